@@ -3,7 +3,7 @@
 import json
 from typing import Any, Dict
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
 
@@ -190,8 +190,6 @@ class EnterpriseAssistantWorkflow:
 
     def _clean_messages(self, messages: list) -> list:
         """Remove or truncate large data from messages to save tokens."""
-        from langchain_core.messages import ToolMessage
-
         cleaned = []
         for msg in messages:
             if isinstance(msg, ToolMessage):
@@ -270,7 +268,6 @@ class EnterpriseAssistantWorkflow:
                                 and result["masked_rows"] != rows
                             ):
                                 data["rows"] = result["masked_rows"]
-                                from langchain_core.messages import ToolMessage
 
                                 # Update with masked data
                                 return {
@@ -366,8 +363,6 @@ class EnterpriseAssistantWorkflow:
             chart_result = {}
             report_result = {}
 
-            from langchain_core.messages import ToolMessage
-
             for msg in reversed(messages):
                 # Get the last text response
                 if (
@@ -385,6 +380,7 @@ class EnterpriseAssistantWorkflow:
                         if data.get("chart_base64"):
                             chart_result = {
                                 "chart_base64": data["chart_base64"],
+                                "mime": data.get("mime", "image/png"),
                                 "chart_type": data.get("chart_type", "bar"),
                                 "data_summary": data.get("data_summary", ""),
                             }
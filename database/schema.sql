@@ -103,4 +103,6 @@ CREATE INDEX IF NOT EXISTS idx_reviews_customer ON reviews(customer_id);
 CREATE INDEX IF NOT EXISTS idx_inventory_product ON inventory_log(product_id);
 CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
 CREATE INDEX IF NOT EXISTS idx_customers_segment ON customers(segment);
-CREATE INDEX IF NOT EXISTS idx_cost_tracking_date ON cost_tracking(created_at);
+-- Covers the cost dashboard aggregations so they never touch the table
+CREATE INDEX IF NOT EXISTS idx_cost_tracking_date_cover
+    ON cost_tracking(created_at, total_tokens, estimated_cost_usd, latency_ms);
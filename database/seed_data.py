@@ -314,7 +314,11 @@ def generate_tracking_number():
 
 
 def seed_database(db_path: str = "database/ecommerce.db"):
-    """Seed the database with realistic e-commerce data."""
+    """Seed the database with realistic e-commerce data.
+
+    Rows are inserted into an in-memory database, then written to db_path in
+    one page-level copy with SQLite's backup API.
+    """
     random.seed(42)  # Reproducibility
 
     db_path = Path(db_path)
@@ -325,7 +329,7 @@ def seed_database(db_path: str = "database/ecommerce.db"):
     with open(schema_path, "r") as f:
         schema_sql = f.read()
 
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(":memory:")
     cursor = conn.cursor()
     cursor.executescript(schema_sql)
 
@@ -613,7 +617,16 @@ def seed_database(db_path: str = "database/ecommerce.db"):
     logger.info(f"Inserted {len(inv_logs)} inventory log entries")
 
     conn.commit()
-    conn.close()
+
+    dest = sqlite3.connect(str(db_path))
+    try:
+        # A failed seed is simply re-run, so skip journaling and fsyncs
+        dest.execute("PRAGMA journal_mode = OFF")
+        dest.execute("PRAGMA synchronous = OFF")
+        conn.backup(dest)
+    finally:
+        dest.close()
+        conn.close()
 
     logger.info(f"Database seeded successfully at {db_path}")
     logger.info(
@@ -9,6 +9,7 @@ from evaluation.eval_agent_decisions import AgentDecisionEvaluator
 from evaluation.eval_guardrails import GuardrailEvaluator
 from evaluation.eval_sql_accuracy import SQLAccuracyEvaluator
 from logger.logging import get_logger, setup_logging
+from utils.config_loader import get_default_config
 
 setup_logging(log_level="INFO")
 logger = get_logger(__name__)
@@ -86,7 +87,6 @@ def run_full_evaluation(max_queries: int = None):
 
 
 if __name__ == "__main__":
-    import os
-
-    max_q = int(os.getenv("EVAL_MAX_QUERIES", "0")) or None
+    # Read through the loader so a value set in .env is picked up
+    max_q = int(get_default_config().get_env("EVAL_MAX_QUERIES", "0")) or None
     run_full_evaluation(max_queries=max_q)
@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 import yaml
 
@@ -67,6 +67,22 @@ class InputGuardrails:
 
         return results
 
+    def check_pipeline(self, user_input: str) -> Iterator[Dict[str, Any]]:
+        """Lazily yield input guardrail results, cheapest check first.
+
+        Query validation starts with an O(1) length check, injection detection
+        can block, and the PII filter only ever warns, so it runs last. Callers
+        can stop iterating at the first blocked result.
+        """
+        if self.input_config.get("query_validation", {}).get("enabled", True):
+            yield self.check_query_validity(user_input)
+
+        if self.input_config.get("injection_detection", {}).get("enabled", True):
+            yield self.check_injection(user_input)
+
+        if self.input_config.get("pii_filter", {}).get("enabled", True):
+            yield self.check_pii(user_input)
+
     def is_blocked(self, results: List[Dict[str, Any]]) -> bool:
         """Check if any guardrail blocked the input."""
         return any(r["status"] == "blocked" for r in results)
@@ -2,18 +2,22 @@
 
 import asyncio
 import json
+import os
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, Dict
 
-from fastapi import Depends, FastAPI, HTTPException
+import orjson
+from anyio import to_thread
+from fastapi import Depends, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from langchain_core.messages import ToolMessage
 
 from agent.agent_workflow import EnterpriseAssistantWorkflow
 from logger.logging import get_logger, setup_logging
-from models.database import DatabaseManager
+from models.database import DB_MAINTENANCE_INTERVAL_S, DatabaseManager
 from models.pydantic_models import (
     CostInfo,
     CostSummary,
@@ -43,7 +47,32 @@ workflow_instance = None
 guardrail_service = None
 cost_service = None
 db_manager = None
-thread_pool = ThreadPoolExecutor(max_workers=4)
+
+# Workflow invocations are sync and I/O-bound (LLM + SQLite), so they run on
+# threads. Size the app pool and Starlette's threadpool (used for sync
+# dependencies) from the same budget so neither silently caps the other.
+THREAD_BUDGET = (os.cpu_count() or 1) * 4
+thread_pool = ThreadPoolExecutor(
+    max_workers=THREAD_BUDGET, thread_name_prefix="workflow"
+)
+
+
+# Dict endpoints return this directly, skipping jsonable_encoder. Model-typed
+# endpoints (/query, /health) keep the default class so FastAPI can serialize
+# them straight to bytes through Pydantic.
+def orjson_response(content: Any) -> Response:
+    """Render a plain dict with orjson for row-heavy endpoints."""
+    return Response(
+        orjson.dumps(content, default=str, option=orjson.OPT_NAIVE_UTC),
+        media_type="application/json",
+    )
+
+
+async def run_db_maintenance():
+    """Periodically refresh SQLite planner statistics."""
+    while True:
+        await asyncio.sleep(DB_MAINTENANCE_INTERVAL_S)
+        await asyncio.to_thread(db_manager.maintenance)
 
 
 @asynccontextmanager
@@ -53,6 +82,8 @@ async def lifespan(app: FastAPI):
 
     try:
         logger.info("Starting Enterprise AI Assistant API")
+        to_thread.current_default_thread_limiter().total_tokens = THREAD_BUDGET
+        logger.info(f"Thread budget set to {THREAD_BUDGET}")
         model_provider = config.get_env("MODEL_PROVIDER", "groq")
 
         db_manager = DatabaseManager()
@@ -62,6 +93,7 @@ async def lifespan(app: FastAPI):
             model_provider=model_provider, guardrail_service=guardrail_service
         )
         workflow_instance.build_graph()
+        maintenance_task = asyncio.create_task(run_db_maintenance())
 
         logger.info("All services initialized successfully")
 
@@ -73,6 +105,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Enterprise AI Assistant API")
+    maintenance_task.cancel()
     thread_pool.shutdown(wait=False)
 
 
@@ -104,7 +137,7 @@ def get_workflow():
 @app.post("/query", response_model=QueryResponse)
 async def query(request: QueryRequest, workflow=Depends(get_workflow)):
     """Main endpoint - process a natural language query."""
-    request_id = str(uuid.uuid4())
+    request_id = uuid.uuid4().hex
     start_time = time.time()
 
     try:
@@ -119,9 +152,10 @@ async def query(request: QueryRequest, workflow=Depends(get_workflow)):
 
         elapsed_ms = round((time.time() - start_time) * 1000, 2)
 
-        # Build cost info
+        # Build cost info. These dicts come from our own services with known
+        # types, so model_construct skips per-field validation.
         cost_data = result.get("cost", {})
-        cost = CostInfo(
+        cost = CostInfo.model_construct(
             prompt_tokens=cost_data.get("prompt_tokens", 0),
             completion_tokens=cost_data.get("completion_tokens", 0),
             total_tokens=cost_data.get("total_tokens", 0),
@@ -133,8 +167,8 @@ async def query(request: QueryRequest, workflow=Depends(get_workflow)):
         guardrail_checks = []
         for gr in result.get("guardrail_results", []):
             guardrail_checks.append(
-                GuardrailResult(
-                    status=gr.get("status", "passed"),
+                GuardrailResult.model_construct(
+                    status=GuardrailStatus(gr.get("status", "passed")),
                     guardrail_name=gr.get("guardrail_name", ""),
                     message=gr.get("message", ""),
                     confidence=gr.get("confidence"),
@@ -166,9 +200,6 @@ async def query(request: QueryRequest, workflow=Depends(get_workflow)):
             chart_data = result["chart_result"]
         elif result.get("messages"):
             # Try to find chart in tool results in message history
-
-            from langchain_core.messages import ToolMessage
-
             for msg in reversed(result["messages"]):
                 if isinstance(msg, ToolMessage):
                     try:
@@ -176,6 +207,7 @@ async def query(request: QueryRequest, workflow=Depends(get_workflow)):
                         if data.get("chart_base64"):
                             chart_data = {
                                 "chart_base64": data["chart_base64"],
+                                "mime": data.get("mime", "image/png"),
                                 "chart_type": data.get("chart_type", "bar"),
                                 "data_summary": data.get("data_summary", ""),
                             }
@@ -189,9 +221,6 @@ async def query(request: QueryRequest, workflow=Depends(get_workflow)):
             report_data = result["report_result"]
         elif result.get("messages"):
             # Try to find report in tool results in message history
-
-            from langchain_core.messages import ToolMessage
-
             for msg in reversed(result["messages"]):
                 if isinstance(msg, ToolMessage):
                     try:
@@ -262,7 +291,7 @@ async def get_cost_summary(days: int = 30):
     """Get aggregate cost summary."""
     if cost_service is None:
         raise HTTPException(status_code=503, detail="Cost service not initialized")
-    return cost_service.get_summary(days)
+    return await cost_service.aget_summary(days)
 
 
 @app.get("/cost/history")
@@ -270,7 +299,7 @@ async def get_cost_history(limit: int = 50, offset: int = 0):
     """Get per-request cost history."""
     if cost_service is None:
         raise HTTPException(status_code=503, detail="Cost service not initialized")
-    return cost_service.get_history(limit, offset)
+    return orjson_response(await cost_service.aget_history(limit, offset))
 
 
 @app.get("/cost/daily")
@@ -278,7 +307,7 @@ async def get_daily_costs(days: int = 30):
     """Get daily cost breakdown."""
     if cost_service is None:
         raise HTTPException(status_code=503, detail="Cost service not initialized")
-    return cost_service.get_daily_breakdown(days)
+    return orjson_response(await cost_service.aget_daily_breakdown(days))
 
 
 # --- Database Endpoints ---
@@ -289,7 +318,7 @@ async def get_schema():
     """Return the database schema."""
     if db_manager is None:
         raise HTTPException(status_code=503, detail="Database not initialized")
-    return {"schema": db_manager.get_schema_summary()}
+    return {"schema": await db_manager.aget_schema_summary()}
 
 
 @app.get("/database/tables")
@@ -297,8 +326,10 @@ async def get_tables():
     """List all available tables."""
     if db_manager is None:
         raise HTTPException(status_code=503, detail="Database not initialized")
-    tables = db_manager.get_table_names()
-    return {"tables": [db_manager.get_table_info(t) for t in tables]}
+    tables = await db_manager.aget_table_names()
+    return orjson_response(
+        {"tables": [await db_manager.aget_table_info(t) for t in tables]}
+    )
 
 
 @app.get("/database/sample/{table_name}")
@@ -306,7 +337,7 @@ async def get_sample(table_name: str, limit: int = 5):
     """Get sample rows from a table."""
     if db_manager is None:
         raise HTTPException(status_code=503, detail="Database not initialized")
-    return db_manager.get_sample_rows(table_name, limit)
+    return orjson_response(await db_manager.aget_sample_rows(table_name, limit))
 
 
 # --- MCP Info ---
@@ -323,6 +354,15 @@ async def list_mcp_tools():
                 "parameters": {
                     "natural_language_query": "str",
                     "max_rows": "int (default 100)",
+                    "columnar": "bool (default false)",
+                },
+            },
+            {
+                "name": "query_database_batch",
+                "description": "Answer several questions with concurrent NL-to-SQL calls",
+                "parameters": {
+                    "queries": "list[str]",
+                    "max_rows": "int (default 100, per question)",
                 },
             },
             {
@@ -4,6 +4,8 @@ Exposes e-commerce database tools via the Model Context Protocol (MCP).
 Uses FastMCP for a clean, decorator-based API.
 """
 
+from typing import List
+
 from mcp.server.fastmcp import FastMCP
 
 from logger.logging import get_logger
@@ -50,7 +52,9 @@ def _get_report_tool():
 
 
 @mcp.tool()
-def query_database(natural_language_query: str, max_rows: int = 100) -> dict:
+def query_database(
+    natural_language_query: str, max_rows: int = 100, columnar: bool = False
+) -> dict:
     """Convert a natural language question about the e-commerce database into SQL,
     execute it, and return the results.
 
@@ -61,12 +65,33 @@ def query_database(natural_language_query: str, max_rows: int = 100) -> dict:
             - "Show me revenue by category for Q4"
             - "Which customers have the highest lifetime value?"
         max_rows: Maximum number of rows to return (default 100).
+        columnar: Return values per column under "data" instead of one dict
+            per row under "rows"; more compact for large numeric results.
+
+    Returns:
+        dict with keys: sql, columns, rows (or data), row_count,
+        execution_time_ms, cost
+    """
+    tool = _get_sql_tool()
+    return tool.execute(natural_language_query, max_rows, columnar)
+
+
+@mcp.tool()
+def query_database_batch(queries: List[str], max_rows: int = 100) -> List[dict]:
+    """Answer several independent questions about the e-commerce database at once.
+
+    SQL for all questions is generated with concurrent LLM calls, then each
+    query is validated and executed on its own.
+
+    Args:
+        queries: Business questions, answered in order.
+        max_rows: Maximum number of rows to return per question (default 100).
 
     Returns:
-        dict with keys: sql, columns, rows, row_count, execution_time_ms, cost
+        list of dicts, one per question, shaped like query_database results
     """
     tool = _get_sql_tool()
-    return tool.execute(natural_language_query, max_rows)
+    return tool.execute_batch(queries, max_rows)
 
 
 @mcp.tool()
@@ -88,7 +113,7 @@ def generate_chart(
         y_label: Y-axis label.
 
     Returns:
-        dict with keys: chart_base64 (PNG), chart_type, data_summary, sql, row_count
+        dict with keys: chart_base64 (WebP), mime, chart_type, data_summary, sql, row_count
     """
     sql_tool = _get_sql_tool()
     query_result = sql_tool.execute(natural_language_query, max_rows=50)
@@ -1,7 +1,7 @@
 """MCP SQL tool backend - NL-to-SQL generation and execution."""
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from logger.logging import get_logger
 from models.database import DatabaseManager
@@ -24,44 +24,81 @@ class SQLTool:
             logger.error(error_msg)
             raise Exception(error_msg)
 
-    def execute(self, question: str, max_rows: int = 100) -> Dict[str, Any]:
-        """Execute a natural language query against the database."""
+    def execute(
+        self, question: str, max_rows: int = 100, columnar: bool = False
+    ) -> Dict[str, Any]:
+        """Execute a natural language query against the database.
+
+        With columnar=True the result carries "data" (column -> values)
+        instead of "rows" (one dict per row).
+        """
         try:
-            result = self.nl_to_sql.execute(question, max_rows=max_rows)
+            return self._format_result(
+                self.nl_to_sql.execute(question, max_rows=max_rows, columnar=columnar)
+            )
 
-            if result.get("error"):
-                return {
+        except Exception as e:
+            error_msg = f"Error in SQLTool.execute -> {str(e)}"
+            logger.error(error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "sql": "",
+                "columns": [],
+                "rows": [],
+                "row_count": 0,
+            }
+
+    def execute_batch(
+        self, questions: List[str], max_rows: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Execute several natural language queries with concurrent LLM calls."""
+        try:
+            results = self.nl_to_sql.execute_batch(questions, max_rows=max_rows)
+            return [self._format_result(result) for result in results]
+
+        except Exception as e:
+            error_msg = f"Error in SQLTool.execute_batch -> {str(e)}"
+            logger.error(error_msg)
+            return [
+                {
                     "success": False,
-                    "error": result["error"],
-                    "sql": result.get("sql", ""),
+                    "error": error_msg,
+                    "sql": "",
                     "columns": [],
                     "rows": [],
                     "row_count": 0,
                 }
+                for _ in questions
+            ]
 
-            return {
-                "success": True,
-                "sql": result["sql"],
-                "columns": result["columns"],
-                "rows": result["rows"],
-                "row_count": result["row_count"],
-                "execution_time_ms": result.get("execution_time_ms", 0),
-                "truncated": result.get("truncated", False),
-                "cost": result.get("cost", {}),
-            }
-
-        except Exception as e:
-            error_msg = f"Error in SQLTool.execute -> {str(e)}"
-            logger.error(error_msg)
+    def _format_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape an NLToSQLService result into the tool response."""
+        if result.get("error"):
             return {
                 "success": False,
-                "error": error_msg,
-                "sql": "",
+                "error": result["error"],
+                "sql": result.get("sql", ""),
                 "columns": [],
                 "rows": [],
                 "row_count": 0,
             }
 
+        output = {
+            "success": True,
+            "sql": result["sql"],
+            "columns": result["columns"],
+            "row_count": result["row_count"],
+            "execution_time_ms": result.get("execution_time_ms", 0),
+            "truncated": result.get("truncated", False),
+            "cost": result.get("cost", {}),
+        }
+        if "data" in result:
+            output["data"] = result["data"]
+        else:
+            output["rows"] = result["rows"]
+        return output
+
     def get_schema(self) -> str:
         """Return the database schema summary."""
         return self.db.get_schema_summary()
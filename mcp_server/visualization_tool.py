@@ -50,6 +50,7 @@ class VisualizationMCPTool:
             return {
                 "success": True,
                 "chart_base64": result["chart_base64"],
+                "mime": result["mime"],
                 "chart_type": result["chart_type"],
                 "data_summary": result.get("data_summary", ""),
             }
@@ -1,27 +1,244 @@
 """SQLite database connection manager for the Enterprise AI Assistant."""
 
+import asyncio
+import atexit
 import os
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from logger.logging import get_logger
-from utils.config_loader import ConfigLoader
+from utils.config_loader import get_default_config
 
 logger = get_logger(__name__)
 
+# Throughput settings applied once when a connection is opened. WAL lets
+# readers run alongside the cost writer and batches fsyncs on commit; it is
+# persistent and set by the writer, since mode=ro readers cannot change it.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Cost rows are written off the request path in batches of up to this many
+# rows, or whatever arrived within the flush interval.
+COST_BATCH_SIZE = 100
+COST_FLUSH_INTERVAL_S = 0.2
+COST_QUEUE_MAXSIZE = 10000
+
+# Worker threads for the async wrappers.
+DB_POOL_WORKERS = 4
+
+# Upper bound on open read-only connections per pool. SQLite in WAL mode
+# serves many readers alongside the single writer, but each handle holds its
+# own page cache, so the count is capped rather than one per thread.
+DB_POOL_READERS = 8
+# Prepared statements kept per connection by the sqlite3 module
+DB_STATEMENT_CACHE = 256
+# Seconds between scheduled ANALYZE runs in the API process
+DB_MAINTENANCE_INTERVAL_S = 24 * 60 * 60
+
+# Kept as one constant so the writer connection's statement cache always
+# hits and executemany reuses a single prepared statement for the batch.
+INSERT_COST_SQL = """INSERT INTO cost_tracking
+   (request_id, query, model_name, prompt_tokens, completion_tokens,
+    total_tokens, estimated_cost_usd, latency_ms, tools_used, guardrail_flags, success)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Applied to existing databases (e.g. downloaded from the HF Dataset) that
+# predate an index in schema.sql. The covering index replaces the plain
+# created_at index, which it makes redundant.
+INDEX_MIGRATIONS = (
+    "CREATE INDEX IF NOT EXISTS idx_cost_tracking_date_cover "
+    "ON cost_tracking(created_at, total_tokens, estimated_cost_usd, latency_ms)",
+    "DROP INDEX IF EXISTS idx_cost_tracking_date",
+)
+
+# Database paths already checked, seeded and migrated in this process
+_DB_READY: Set[str] = set()
+_DB_READY_LOCK = threading.Lock()
+
+
+class ConnectionPool:
+    """Bounded SQLite pool: one shared writer plus up to N read-only readers."""
+
+    def __init__(self, db_path: str, max_readers: int = DB_POOL_READERS):
+        self.db_path = db_path
+        self._reader_uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+        self._readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(max_readers)
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._opened: List[sqlite3.Connection] = []
+        self._opened_lock = threading.Lock()
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        if read_only:
+            conn = sqlite3.connect(
+                self._reader_uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=DB_STATEMENT_CACHE,
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=DB_STATEMENT_CACHE,
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        with self._opened_lock:
+            self._opened.append(conn)
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, blocking while all readers are in use."""
+        self._reader_slots.acquire()
+        try:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                conn = self._open(read_only=True)
+            try:
+                yield conn
+            finally:
+                self._readers.put(conn)
+        finally:
+            self._reader_slots.release()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared writable connection for the duration of the block."""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open(read_only=False)
+            yield self._writer
+
+    def close(self):
+        """Close every connection, refreshing planner statistics on the writer."""
+        with self._write_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except Exception as e:
+                    logger.warning(f"PRAGMA optimize failed -> {str(e)}")
+                self._writer = None
+        with self._opened_lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
+        while not self._readers.empty():
+            self._readers.get_nowait()
+
+
+class SharedDatabase:
+    """Pool, worker threads and cost writer state for one database file.
+
+    Every DatabaseManager and CostService on the same path uses one of these,
+    so the reader bound and thread counts hold per process, not per instance.
+    """
+
+    def __init__(self, db_path: str):
+        self.connections = ConnectionPool(db_path)
+        self.executor = ThreadPoolExecutor(
+            max_workers=DB_POOL_WORKERS, thread_name_prefix="db"
+        )
+        self.cost_queue: queue.Queue = queue.Queue(maxsize=COST_QUEUE_MAXSIZE)
+        self.cost_writer: Optional[threading.Thread] = None
+        self.cost_writer_lock = threading.Lock()
+        # Schema-derived values keyed by name -> (schema_version, value)
+        self.schema_cache: Dict[str, Tuple[int, Any]] = {}
+
+    def stop_cost_writer(self, timeout: float = 5.0):
+        """Signal the cost writer to drain the queue and wait for it to exit."""
+        with self.cost_writer_lock:
+            writer = self.cost_writer
+            self.cost_writer = None
+        if writer is not None:
+            self.cost_queue.put(None)
+            writer.join(timeout)
+
+    def close(self):
+        """Flush pending cost rows, then close the shared connections."""
+        self.stop_cost_writer()
+        self.executor.shutdown(wait=True)
+        self.connections.close()
+
+
+# Shared resources keyed by absolute database path
+_SHARED: Dict[str, SharedDatabase] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_shared_database(db_path: str) -> SharedDatabase:
+    """Return the process-wide resources for db_path, creating them once."""
+    key = os.path.abspath(db_path)
+    shared = _SHARED.get(key)
+    if shared is None:
+        with _SHARED_LOCK:
+            shared = _SHARED.get(key)
+            if shared is None:
+                shared = _SHARED[key] = SharedDatabase(db_path)
+                atexit.register(shared.close)
+    return shared
+
+
+def ensure_database_ready(db_path: str) -> SharedDatabase:
+    """Seed, migrate and switch the database to WAL once per process and path.
+
+    Must run before any reader is opened: the writer connection it opens is
+    what puts the file in WAL mode.
+    """
+    shared = get_shared_database(db_path)
+    key = os.path.abspath(db_path)
+    if key in _DB_READY:
+        return shared
+    with _DB_READY_LOCK:
+        if key in _DB_READY:
+            return shared
+        if not Path(db_path).exists():
+            logger.info("Database not found, creating and seeding...")
+            from database.seed_data import seed_database
+
+            seed_database(db_path)
+        # Create indexes missing from databases seeded by an older schema
+        with shared.connections.writer() as conn:
+            for statement in INDEX_MIGRATIONS:
+                conn.execute(statement)
+            conn.commit()
+        _DB_READY.add(key)
+    return shared
+
 
 class DatabaseManager:
     """Manages SQLite database connections and operations."""
 
     def __init__(self):
         try:
-            self.config = ConfigLoader()
+            self.config = get_default_config()
             self.db_path = os.environ.get(
                 "DATABASE_PATH",
                 self.config.get("database.path", "database/ecommerce.db"),
             )
-            self._ensure_db_exists()
+            self._shared = ensure_database_ready(self.db_path)
+            self._connections = self._shared.connections
+            self._executor = self._shared.executor
+            self._cost_queue = self._shared.cost_queue
+            self._schema_cache = self._shared.schema_cache
             logger.info(f"DatabaseManager initialized with {self.db_path}")
 
         except Exception as e:
@@ -29,51 +246,71 @@ class DatabaseManager:
             logger.error(error_msg)
             raise Exception(error_msg)
 
-    def _ensure_db_exists(self):
-        """Create and seed database if it doesn't exist."""
-        db_file = Path(self.db_path)
-        if not db_file.exists():
-            logger.info("Database not found, creating and seeding...")
-            from database.seed_data import seed_database
+    def close(self):
+        """Flush pending cost rows, then close the path's shared connections."""
+        self._shared.close()
 
-            seed_database(self.db_path)
+    def maintenance(self):
+        """Refresh cost_tracking planner statistics."""
+        try:
+            with self._connections.writer() as conn:
+                conn.execute("ANALYZE cost_tracking")
+                conn.execute("PRAGMA optimize")
+                conn.commit()
+            logger.info("Database maintenance completed")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        except Exception as e:
+            logger.error(f"Error running database maintenance -> {str(e)}")
+
+    def _schema_version(self) -> int:
+        """Return SQLite's schema cookie, which changes on every DDL statement."""
+        with self._connections.reader() as conn:
+            return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _get_cached(self, key: str, version: int) -> Any:
+        """Return a cached schema-derived value if it matches the schema version."""
+        cached = self._schema_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        return None
 
     def execute_query(
-        self, sql: str, params: tuple = (), max_rows: int = 100
+        self, sql: str, params: tuple = (), max_rows: int = 100, columnar: bool = False
     ) -> Dict[str, Any]:
-        """Execute a SELECT query and return results."""
-        conn = None
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            import time
+        """Execute a SELECT query and return results.
 
-            start = time.time()
-            cursor.execute(sql, params)
-            rows = cursor.fetchmany(max_rows)
-            elapsed_ms = round((time.time() - start) * 1000, 2)
+        Rows come back as one dict per row, or with columnar=True as a single
+        "data" dict mapping each column to its list of values.
+        """
+        try:
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+                # Plain tuples; each row becomes a dict exactly once below
+                cursor.row_factory = None
+
+                start = time.time()
+                cursor.execute(sql, params)
+                rows = cursor.fetchmany(max_rows)
+                # Release the statement so the pooled reader holds no snapshot
+                cursor.close()
+                elapsed_ms = round((time.time() - start) * 1000, 2)
 
             columns = (
                 [desc[0] for desc in cursor.description] if cursor.description else []
             )
-            data = [dict(row) for row in rows]
-
-            return {
+            result = {
                 "columns": columns,
-                "rows": data,
-                "row_count": len(data),
+                "row_count": len(rows),
                 "execution_time_ms": elapsed_ms,
                 "sql": sql,
-                "truncated": len(data) == max_rows,
+                "truncated": len(rows) == max_rows,
             }
+            if columnar:
+                values = zip(*rows) if rows else ([] for _ in columns)
+                result["data"] = {c: list(v) for c, v in zip(columns, values)}
+            else:
+                result["rows"] = [dict(zip(columns, row)) for row in rows]
+            return result
 
         except Exception as e:
             error_msg = f"Error executing query -> {str(e)}"
@@ -85,77 +322,114 @@ class DatabaseManager:
                 "columns": [],
                 "row_count": 0,
             }
-        finally:
-            if conn:
-                conn.close()
 
     def get_schema(self) -> str:
         """Return the full database schema as DDL."""
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            version = self._schema_version()
+            cached = self._get_cached("schema", version)
+            if cached is not None:
+                return cached
 
-            cursor.execute(
-                "SELECT sql FROM sqlite_master WHERE type='table' AND sql IS NOT NULL ORDER BY name"
-            )
-            tables = cursor.fetchall()
+            with self._connections.reader() as conn:
+                tables = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE type='table' AND sql IS NOT NULL ORDER BY name"
+                ).fetchall()
 
             schema_parts = []
             for table in tables:
                 schema_parts.append(table["sql"] + ";")
 
-            return "\n\n".join(schema_parts)
+            schema = "\n\n".join(schema_parts)
+            self._schema_cache["schema"] = (version, schema)
+            return schema
 
         except Exception as e:
             error_msg = f"Error getting schema -> {str(e)}"
             logger.error(error_msg)
             return ""
-        finally:
-            if conn:
-                conn.close()
 
     def get_table_names(self) -> List[str]:
         """Return list of table names."""
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
-            )
-            tables = [row["name"] for row in cursor.fetchall()]
+            version = self._schema_version()
+            cached = self._get_cached("table_names", version)
+            if cached is not None:
+                return list(cached)
+
+            with self._connections.reader() as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+                ).fetchall()
+            tables = [row["name"] for row in rows]
+            self._schema_cache["table_names"] = (version, tuple(tables))
             return tables
 
         except Exception as e:
             logger.error(f"Error getting table names -> {str(e)}")
             return []
-        finally:
-            if conn:
-                conn.close()
+
+    def stream_query(
+        self, sql: str, params: tuple = (), chunk: int = 200
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield query results as lists of up to `chunk` row dicts.
+
+        The pooled reader stays checked out until the generator is exhausted
+        or closed, so consume it promptly.
+        """
+        try:
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                try:
+                    cursor.execute(sql, params)
+                    columns = [desc[0] for desc in cursor.description or ()]
+                    while True:
+                        rows = cursor.fetchmany(chunk)
+                        if not rows:
+                            break
+                        yield [dict(zip(columns, row)) for row in rows]
+                finally:
+                    cursor.close()
+
+        except Exception as e:
+            error_msg = f"Error streaming query -> {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    def _is_known_table(self, table_name: str) -> bool:
+        """Check a table name against the cached schema before interpolating it."""
+        version = self._schema_version()
+        cached = self._get_cached("table_set", version)
+        if cached is None:
+            cached = frozenset(self.get_table_names())
+            self._schema_cache["table_set"] = (version, cached)
+        return table_name in cached
 
     def get_table_info(self, table_name: str) -> Dict[str, Any]:
         """Get detailed info about a table."""
-        conn = None
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Column info
-            cursor.execute(f"PRAGMA table_info('{table_name}')")
-            columns = [
-                {
-                    "name": r["name"],
-                    "type": r["type"],
-                    "notnull": r["notnull"],
-                    "pk": r["pk"],
-                }
-                for r in cursor.fetchall()
-            ]
-
-            # Row count
-            cursor.execute(f"SELECT COUNT(*) as count FROM '{table_name}'")
-            row_count = cursor.fetchone()["count"]
+            if not self._is_known_table(table_name):
+                raise ValueError(f"Unknown table: {table_name}")
+
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+
+                # Column info
+                cursor.execute(f"PRAGMA table_info('{table_name}')")
+                columns = [
+                    {
+                        "name": r["name"],
+                        "type": r["type"],
+                        "notnull": r["notnull"],
+                        "pk": r["pk"],
+                    }
+                    for r in cursor.fetchall()
+                ]
+
+                # Row count
+                cursor.execute(f"SELECT COUNT(*) as count FROM '{table_name}'")
+                row_count = cursor.fetchone()["count"]
 
             return {
                 "table_name": table_name,
@@ -171,55 +445,75 @@ class DatabaseManager:
                 "row_count": 0,
                 "error": str(e),
             }
-        finally:
-            if conn:
-                conn.close()
 
     def get_sample_rows(self, table_name: str, limit: int = 5) -> Dict[str, Any]:
         """Get sample rows from a table."""
+        if not self._is_known_table(table_name):
+            error_msg = f"Unknown table: {table_name}"
+            logger.error(error_msg)
+            return {"error": error_msg, "rows": [], "columns": [], "row_count": 0}
         return self.execute_query(
             f"SELECT * FROM '{table_name}' LIMIT ?", (limit,), max_rows=limit
         )
 
     def get_schema_summary(self) -> str:
-        """Get a formatted schema summary with table info and sample data for LLM context."""
+        """Get a formatted schema summary with table info and sample data for LLM context.
+
+        The summary is rebuilt only when the schema version changes.
+        """
         try:
+            version = self._schema_version()
+            cached = self._get_cached("summary", version)
+            if cached is not None:
+                return cached
+
             tables = self.get_table_names()
             # Exclude internal tables
             tables = [t for t in tables if t != "cost_tracking"]
 
-            summary_parts = ["## E-Commerce Database Schema\n"]
-
-            for table in tables:
-                info = self.get_table_info(table)
-                summary_parts.append(f"### Table: {table} ({info['row_count']} rows)")
-
-                col_lines = []
-                for col in info["columns"]:
-                    pk = " [PK]" if col["pk"] else ""
-                    nn = " NOT NULL" if col["notnull"] else ""
-                    col_lines.append(f"  - {col['name']} ({col['type']}{pk}{nn})")
-                summary_parts.append("\n".join(col_lines))
-
-                # Sample data
-                sample = self.get_sample_rows(table, limit=3)
-                if sample.get("rows"):
-                    sample_rows = sample["rows"][:2]
-                    # Clean sample rows to truncate long strings
-                    cleaned_samples = []
-                    for row in sample_rows:
-                        cleaned_row = {}
-                        for k, v in row.items():
-                            if isinstance(v, str) and len(v) > 100:
-                                cleaned_row[k] = v[:100] + "..."
-                            else:
-                                cleaned_row[k] = v
-                        cleaned_samples.append(cleaned_row)
-                    summary_parts.append(f"  Sample: {cleaned_samples}")
-
-                summary_parts.append("")
-
-            return "\n".join(summary_parts)
+            # One connection and two statements per table. Tables are
+            # append-only with INTEGER PRIMARY KEYs, so MAX(rowid) gives the
+            # row count from the B-tree edge instead of a COUNT(*) scan.
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+                summary_parts = ["## E-Commerce Database Schema\n"]
+
+                for table in tables:
+                    row_count = cursor.execute(
+                        f"SELECT COALESCE(MAX(rowid), 0) FROM '{table}'"
+                    ).fetchone()[0]
+                    summary_parts.append(f"### Table: {table} ({row_count} rows)")
+
+                    col_lines = []
+                    for col in cursor.execute(f"PRAGMA table_info('{table}')"):
+                        pk = " [PK]" if col["pk"] else ""
+                        nn = " NOT NULL" if col["notnull"] else ""
+                        col_lines.append(f"  - {col['name']} ({col['type']}{pk}{nn})")
+                    summary_parts.append("\n".join(col_lines))
+
+                    # Sample data
+                    sample_rows = cursor.execute(
+                        f"SELECT * FROM '{table}' LIMIT 2"
+                    ).fetchall()
+                    if sample_rows:
+                        # Clean sample rows to truncate long strings
+                        cleaned_samples = []
+                        for row in sample_rows:
+                            cleaned_row = {}
+                            for k, v in dict(row).items():
+                                if isinstance(v, str) and len(v) > 100:
+                                    cleaned_row[k] = v[:100] + "..."
+                                else:
+                                    cleaned_row[k] = v
+                            cleaned_samples.append(cleaned_row)
+                        summary_parts.append(f"  Sample: {cleaned_samples}")
+
+                    summary_parts.append("")
+                cursor.close()
+
+            summary = "\n".join(summary_parts)
+            self._schema_cache["summary"] = (version, summary)
+            return summary
 
         except Exception as e:
             logger.error(f"Error getting schema summary -> {str(e)}")
@@ -239,16 +533,10 @@ class DatabaseManager:
         guardrail_flags: str = None,
         success: bool = True,
     ):
-        """Record a cost tracking entry."""
-        conn = None
+        """Queue a cost tracking entry for the background writer."""
+        self._start_cost_writer()
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                """INSERT INTO cost_tracking
-                   (request_id, query, model_name, prompt_tokens, completion_tokens,
-                    total_tokens, estimated_cost_usd, latency_ms, tools_used, guardrail_flags, success)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            self._cost_queue.put_nowait(
                 (
                     request_id,
                     query,
@@ -261,12 +549,104 @@ class DatabaseManager:
                     tools_used,
                     guardrail_flags,
                     success,
-                ),
+                )
             )
-            conn.commit()
+
+        except queue.Full:
+            logger.error(f"Cost queue full, dropping entry for {request_id}")
+
+    def _start_cost_writer(self):
+        """Start the path's cost writer thread on first use."""
+        shared = self._shared
+        if shared.cost_writer is not None:
+            return
+        with shared.cost_writer_lock:
+            if shared.cost_writer is None:
+                shared.cost_writer = threading.Thread(
+                    target=self._run_cost_writer, name="cost-writer", daemon=True
+                )
+                shared.cost_writer.start()
+
+    def _run_cost_writer(self):
+        """Drain the cost queue, committing rows in batches."""
+        stopping = False
+        while not stopping:
+            item = self._cost_queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + COST_FLUSH_INTERVAL_S
+            while len(batch) < COST_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._cost_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_cost_batch(batch)
+
+    def _write_cost_batch(self, batch: List[tuple]):
+        """Insert a batch of cost rows in a single transaction.
+
+        If one row violates a constraint, the batch is retried row by row so
+        only the offending rows are dropped.
+        """
+        try:
+            with self._connections.writer() as conn:
+                try:
+                    conn.executemany(INSERT_COST_SQL, batch)
+                    conn.commit()
+                    return
+                except sqlite3.IntegrityError:
+                    conn.rollback()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+                for row in batch:
+                    try:
+                        conn.execute(INSERT_COST_SQL, row)
+                    except sqlite3.IntegrityError as e:
+                        logger.error(f"Dropped cost row for {row[0]} -> {str(e)}")
+                conn.commit()
 
         except Exception as e:
-            logger.error(f"Error recording cost -> {str(e)}")
-        finally:
-            if conn:
-                conn.close()
+            logger.error(f"Error recording cost batch of {len(batch)} -> {str(e)}")
+
+    # --- Async wrappers ---
+
+    async def _run_in_pool(self, fn: Callable, *args) -> Any:
+        """Run a blocking method on the DB pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def aexecute_query(
+        self, sql: str, params: tuple = (), max_rows: int = 100, columnar: bool = False
+    ) -> Dict[str, Any]:
+        """Async version of execute_query."""
+        return await self._run_in_pool(
+            self.execute_query, sql, params, max_rows, columnar
+        )
+
+    async def aget_table_names(self) -> List[str]:
+        """Async version of get_table_names."""
+        return await self._run_in_pool(self.get_table_names)
+
+    async def aget_table_info(self, table_name: str) -> Dict[str, Any]:
+        """Async version of get_table_info."""
+        return await self._run_in_pool(self.get_table_info, table_name)
+
+    async def aget_sample_rows(self, table_name: str, limit: int = 5) -> Dict[str, Any]:
+        """Async version of get_sample_rows."""
+        return await self._run_in_pool(self.get_sample_rows, table_name, limit)
+
+    async def aget_schema_summary(self) -> str:
+        """Async version of get_schema_summary."""
+        return await self._run_in_pool(self.get_schema_summary)
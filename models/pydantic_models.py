@@ -94,7 +94,8 @@ class SQLResult(BaseModel):
 class ChartResult(BaseModel):
     """Result of chart generation."""
 
-    chart_base64: str = Field(..., description="Base64-encoded PNG image")
+    chart_base64: str = Field(..., description="Base64-encoded chart image")
+    mime: str = Field("image/png", description="MIME type of chart_base64")
     chart_type: str = Field(..., description="Chart type used")
     data_summary: str = Field("", description="Brief text summary of the data")
 
@@ -1,11 +1,13 @@
 """Cost tracking and analytics service."""
 
+import asyncio
 import os
-import sqlite3
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
 
 from logger.logging import get_logger
-from utils.config_loader import ConfigLoader
+from models.database import ensure_database_ready
+from utils.config_loader import get_default_config
 
 logger = get_logger(__name__)
 
@@ -15,11 +17,16 @@ class CostService:
 
     def __init__(self):
         try:
-            self.config = ConfigLoader()
+            self.config = get_default_config()
             self.db_path = os.environ.get(
                 "DATABASE_PATH",
                 self.config.get("database.path", "database/ecommerce.db"),
             )
+            # Readers need the file seeded and in WAL mode before they open;
+            # analytics never write, so only read-only readers are borrowed
+            shared = ensure_database_ready(self.db_path)
+            self._connections = shared.connections
+            self._executor = shared.executor
             logger.info("CostService initialized")
 
         except Exception as e:
@@ -27,37 +34,32 @@ class CostService:
             logger.error(error_msg)
             raise Exception(error_msg)
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    @staticmethod
+    def _cutoff(days: int) -> str:
+        """Return the UTC timestamp `days` ago in SQLite's CURRENT_TIMESTAMP format."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        return cutoff.strftime("%Y-%m-%d %H:%M:%S")
 
     def get_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get aggregate cost summary for the specified period."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT
-                    COUNT(*) as total_requests,
-                    COALESCE(SUM(total_tokens), 0) as total_tokens,
-                    COALESCE(SUM(estimated_cost_usd), 0) as total_cost_usd,
-                    COALESCE(AVG(total_tokens), 0) as avg_tokens_per_request,
-                    COALESCE(AVG(estimated_cost_usd), 0) as avg_cost_per_request,
-                    COALESCE(AVG(latency_ms), 0) as avg_latency_ms,
-                    MIN(created_at) as period_start,
-                    MAX(created_at) as period_end
-                FROM cost_tracking
-                WHERE created_at >= datetime('now', ?)
-            """,
-                (f"-{days} days",),
-            )
-
-            row = cursor.fetchone()
-            conn.close()
+            with self._connections.reader() as conn:
+                row = conn.execute(
+                    """
+                    SELECT
+                        COUNT(*) as total_requests,
+                        COALESCE(SUM(total_tokens), 0) as total_tokens,
+                        COALESCE(SUM(estimated_cost_usd), 0) as total_cost_usd,
+                        COALESCE(AVG(total_tokens), 0) as avg_tokens_per_request,
+                        COALESCE(AVG(estimated_cost_usd), 0) as avg_cost_per_request,
+                        COALESCE(AVG(latency_ms), 0) as avg_latency_ms,
+                        MIN(created_at) as period_start,
+                        MAX(created_at) as period_end
+                    FROM cost_tracking
+                    WHERE created_at >= ?
+                """,
+                    (self._cutoff(days),),
+                ).fetchone()
 
             return {
                 "total_requests": row["total_requests"],
@@ -77,23 +79,25 @@ class CostService:
     def get_history(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         """Get per-request cost history."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT request_id, query, model_name, prompt_tokens, completion_tokens,
-                       total_tokens, estimated_cost_usd, latency_ms, tools_used,
-                       guardrail_flags, success, created_at
-                FROM cost_tracking
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (limit, offset),
-            )
-
-            rows = [dict(r) for r in cursor.fetchall()]
-            conn.close()
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+
+                cursor.execute(
+                    """
+                    SELECT request_id, query, model_name, prompt_tokens, completion_tokens,
+                           total_tokens, estimated_cost_usd, latency_ms, tools_used,
+                           guardrail_flags, success, created_at
+                    FROM cost_tracking
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (limit, offset),
+                )
+                rows = cursor.fetchall()
+
+            columns = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(columns, r)) for r in rows]
             return rows
 
         except Exception as e:
@@ -103,29 +107,52 @@ class CostService:
     def get_daily_breakdown(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get daily cost breakdown for charts."""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT
-                    DATE(created_at) as date,
-                    COUNT(*) as requests,
-                    SUM(total_tokens) as tokens,
-                    SUM(estimated_cost_usd) as cost_usd,
-                    AVG(latency_ms) as avg_latency_ms
-                FROM cost_tracking
-                WHERE created_at >= datetime('now', ?)
-                GROUP BY DATE(created_at)
-                ORDER BY date
-            """,
-                (f"-{days} days",),
-            )
-
-            rows = [dict(r) for r in cursor.fetchall()]
-            conn.close()
+            with self._connections.reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+
+                cursor.execute(
+                    """
+                    SELECT
+                        DATE(created_at) as date,
+                        COUNT(*) as requests,
+                        SUM(total_tokens) as tokens,
+                        SUM(estimated_cost_usd) as cost_usd,
+                        AVG(latency_ms) as avg_latency_ms
+                    FROM cost_tracking
+                    WHERE created_at >= ?
+                    GROUP BY DATE(created_at)
+                    ORDER BY date
+                """,
+                    (self._cutoff(days),),
+                )
+                rows = cursor.fetchall()
+
+            columns = [desc[0] for desc in cursor.description]
+            rows = [dict(zip(columns, r)) for r in rows]
             return rows
 
         except Exception as e:
             logger.error(f"Error getting daily breakdown -> {str(e)}")
             return []
+
+    # --- Async wrappers ---
+
+    async def _run_in_pool(self, fn: Callable, *args) -> Any:
+        """Run a blocking method on the DB pool without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def aget_summary(self, days: int = 30) -> Dict[str, Any]:
+        """Async version of get_summary."""
+        return await self._run_in_pool(self.get_summary, days)
+
+    async def aget_history(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Async version of get_history."""
+        return await self._run_in_pool(self.get_history, limit, offset)
+
+    async def aget_daily_breakdown(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Async version of get_daily_breakdown."""
+        return await self._run_in_pool(self.get_daily_breakdown, days)
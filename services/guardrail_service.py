@@ -1,5 +1,6 @@
 """Guardrail orchestration service - coordinates input and output guardrails."""
 
+from collections import Counter
 from typing import Any, Dict, List
 
 from guardrails.input_guardrails import InputGuardrails
@@ -16,7 +17,7 @@ class GuardrailService:
         try:
             self.input_guardrails = InputGuardrails()
             self.output_guardrails = OutputGuardrails()
-            self._stats = {"total_checks": 0, "blocks": 0, "warnings": 0, "passes": 0}
+            self._stats = Counter(total_checks=0, blocks=0, warnings=0, passes=0)
             logger.info("GuardrailService initialized")
 
         except Exception as e:
@@ -25,26 +26,29 @@ class GuardrailService:
             raise Exception(error_msg)
 
     def check_input(self, user_input: str) -> Dict[str, Any]:
-        """Run all input guardrails.
+        """Run input guardrails, stopping at the first one that blocks.
 
         Returns:
             Dict with: allowed (bool), results (list), block_reason (str)
         """
-        results = self.input_guardrails.check_all(user_input)
+        results = []
+        for result in self.input_guardrails.check_pipeline(user_input):
+            results.append(result)
+            if result["status"] == "blocked":
+                break
         is_blocked = self.input_guardrails.is_blocked(results)
         block_reason = (
             self.input_guardrails.get_block_reason(results) if is_blocked else ""
         )
 
-        # Update stats
-        self._stats["total_checks"] += 1
-        for r in results:
-            if r["status"] == "blocked":
-                self._stats["blocks"] += 1
-            elif r["status"] == "warning":
-                self._stats["warnings"] += 1
-            else:
-                self._stats["passes"] += 1
+        # Update stats for the checks that actually ran
+        counts = Counter(r["status"] for r in results)
+        self._stats.update(
+            total_checks=1,
+            blocks=counts["blocked"],
+            warnings=counts["warning"],
+            passes=counts["passed"],
+        )
 
         return {
             "allowed": not is_blocked,
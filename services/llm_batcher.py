@@ -0,0 +1,181 @@
+"""Routes LLM calls through one event loop so they run concurrently."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import (
+    ensure_config,
+    get_callback_manager_for_config,
+)
+
+from logger.logging import get_logger
+
+logger = get_logger(__name__)
+
+# One batcher per LLM client, so every service using that client shares a queue
+_BATCHERS: Dict[int, "AsyncLLMBatcher"] = {}
+_BATCHERS_LOCK = threading.Lock()
+
+
+def get_batcher(llm: Any) -> "AsyncLLMBatcher":
+    """Return the process-wide batcher for llm, creating it on first use."""
+    with _BATCHERS_LOCK:
+        batcher = _BATCHERS.get(id(llm))
+        # The batcher holds llm, so its id cannot be reused while registered
+        if batcher is None:
+            batcher = _BATCHERS[id(llm)] = AsyncLLMBatcher(llm)
+        return batcher
+
+
+def _caller_config() -> RunnableConfig:
+    """Snapshot the calling thread's runnable config with callbacks resolved.
+
+    Tracing handlers set through context variables (LangSmith, collect_runs)
+    are only visible on the submitting thread, so they are bound into a
+    callback manager before the call moves to the batcher loop.
+    """
+    config = ensure_config()
+    config["callbacks"] = get_callback_manager_for_config(config)
+    return config
+
+
+class AsyncLLMBatcher:
+    """Sends queued prompts to the model via llm.abatch() from its own event loop.
+
+    The batcher owns an event loop on a daemon thread, so both async callers
+    (``await submit(...)``) and the sync workflow threads (``invoke(...)``)
+    share the same queue. Chat models run abatch as concurrent ainvoke calls,
+    so requests are dispatched as soon as they arrive; window_ms > 0 only pays
+    off for a backend with a real batch endpoint.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        max_batch: int = 32,
+        window_ms: int = 0,
+        timeout_s: float = 120.0,
+    ):
+        try:
+            self.llm = llm
+            self.max_batch = max_batch
+            self.window_s = window_ms / 1000
+            self.timeout_s = timeout_s
+            self._loop = asyncio.new_event_loop()
+            self._queue: asyncio.Queue = asyncio.Queue()
+            self._ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run_loop, name="llm-batcher", daemon=True
+            )
+            self._thread.start()
+            self._ready.wait()
+            logger.info("AsyncLLMBatcher initialized")
+
+        except Exception as e:
+            error_msg = f"Error in AsyncLLMBatcher Initialization -> {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    def _run_loop(self):
+        """Run the batcher's event loop until close() stops it."""
+        asyncio.set_event_loop(self._loop)
+        drain = self._loop.create_task(self._drain())
+        self._ready.set()
+        self._loop.run_forever()
+        drain.cancel()
+        self._loop.run_until_complete(asyncio.gather(drain, return_exceptions=True))
+        self._loop.close()
+
+    async def _drain(self):
+        """Group queued requests into batches of at most max_batch."""
+        while True:
+            items = [await self._queue.get()]
+            # Take whatever is already queued without waiting for more
+            while len(items) < self.max_batch and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            deadline = self._loop.time() + self.window_s
+            while len(items) < self.max_batch:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can form meanwhile
+            self._loop.create_task(self._dispatch(items))
+
+    async def _dispatch(self, items: List[Tuple[list, RunnableConfig, asyncio.Future]]):
+        """Run the requests concurrently and resolve each caller's future."""
+        try:
+            responses = await self.llm.abatch(
+                [messages for messages, _, _ in items],
+                config=[config for _, config, _ in items],
+                return_exceptions=True,
+            )
+        except Exception as e:
+            responses = [e] * len(items)
+
+        for (_, _, future), response in zip(items, responses):
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+    async def _enqueue(self, messages: list, config: RunnableConfig) -> Any:
+        """Queue messages on the batcher loop and wait for their response."""
+        future = self._loop.create_future()
+        await self._queue.put((messages, config, future))
+        return await future
+
+    def _submit_threadsafe(self, messages: list) -> Future:
+        """Schedule messages from any thread, carrying the caller's config."""
+        return asyncio.run_coroutine_threadsafe(
+            self._enqueue(messages, _caller_config()), self._loop
+        )
+
+    def _wait(self, future: Future, deadline: float) -> Any:
+        """Wait for a submitted call until deadline (time.monotonic)."""
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"LLM call timed out after {self.timeout_s}s")
+
+    async def submit(self, messages: list) -> Any:
+        """Await the model response for messages from any event loop."""
+        return await asyncio.wait_for(
+            asyncio.wrap_future(self._submit_threadsafe(messages)), self.timeout_s
+        )
+
+    def invoke(self, messages: list) -> Any:
+        """Blocking equivalent of submit for sync callers."""
+        deadline = time.monotonic() + self.timeout_s
+        return self._wait(self._submit_threadsafe(messages), deadline)
+
+    def invoke_many(self, messages_list: List[list]) -> List[Any]:
+        """Queue several prompts at once so they run concurrently, then wait for all.
+
+        Exceptions are returned in place of the failed responses.
+        """
+        deadline = time.monotonic() + self.timeout_s
+        futures = [self._submit_threadsafe(messages) for messages in messages_list]
+        responses = []
+        for future in futures:
+            try:
+                responses.append(self._wait(future, deadline))
+            except Exception as e:
+                responses.append(e)
+        return responses
+
+    def close(self):
+        """Stop the batcher loop and close it."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
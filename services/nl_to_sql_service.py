@@ -1,13 +1,16 @@
 """Natural language to SQL conversion service."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from langchain_core.messages import HumanMessage, SystemMessage
 
 from logger.logging import get_logger
 from models.database import DatabaseManager
 from prompt_library.prompts import NL_TO_SQL_SYSTEM_PROMPT, NL_TO_SQL_USER_PROMPT
+from services.llm_batcher import get_batcher
 from utils.cost_tracker import CostTracker
 from utils.model_loader import ModelLoader
-from utils.sql_utils import extract_sql_from_response, validate_sql
+from utils.sql_utils import extract_sql_from_response, limit_sql, validate_sql
 
 logger = get_logger(__name__)
 
@@ -19,9 +22,12 @@ class NLToSQLService:
         try:
             self.model_loader = ModelLoader(model_provider)
             self.llm = self.model_loader.load_llm()
+            self.batcher = get_batcher(self.llm)
             self.db = DatabaseManager()
             self.cost_tracker = CostTracker()
-            self.schema = self.db.get_schema_summary()
+            self.schema = None
+            self._system_message = SystemMessage(content="")
+            self._get_system_message()
             logger.info("NLToSQLService initialized")
 
         except Exception as e:
@@ -29,40 +35,91 @@ class NLToSQLService:
             logger.error(error_msg)
             raise Exception(error_msg)
 
+    def _get_system_message(self) -> SystemMessage:
+        """Return the schema-filled system message, rebuilding only on schema change.
+
+        get_schema_summary returns the same cached string until the schema
+        version changes, so an identity check is enough here. Reusing one
+        message keeps the prompt prefix byte-identical across requests.
+        """
+        schema = self.db.get_schema_summary()
+        if schema is not self.schema:
+            self.schema = schema
+            self._system_message = SystemMessage(
+                content=NL_TO_SQL_SYSTEM_PROMPT.format(schema=schema)
+            )
+        return self._system_message
+
+    def _build_messages(self, question: str) -> list:
+        """Build the prompt messages for one question."""
+        user_prompt = NL_TO_SQL_USER_PROMPT.format(question=question)
+        return [self._get_system_message(), HumanMessage(content=user_prompt)]
+
+    def _parse_response(self, response: Any) -> Dict[str, Any]:
+        """Track cost and pull the SQL out of one LLM response."""
+        cost_info = self.cost_tracker.track_call(response)
+        sql = extract_sql_from_response(response.content)
+
+        return {
+            "sql": sql,
+            "cost": cost_info,
+            "raw_response": response.content,
+        }
+
     def generate_sql(self, question: str) -> Dict[str, Any]:
         """Generate SQL from a natural language question."""
         try:
-            system_prompt = NL_TO_SQL_SYSTEM_PROMPT.format(schema=self.schema)
-            user_prompt = NL_TO_SQL_USER_PROMPT.format(question=question)
-
-            from langchain_core.messages import HumanMessage, SystemMessage
-
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt),
-            ]
-
-            response = self.llm.invoke(messages)
-            cost_info = self.cost_tracker.track_call(response)
-
-            sql = extract_sql_from_response(response.content)
-
-            return {
-                "sql": sql,
-                "cost": cost_info,
-                "raw_response": response.content,
-            }
+            response = self.batcher.invoke(self._build_messages(question))
+            return self._parse_response(response)
 
         except Exception as e:
             error_msg = f"Error generating SQL -> {str(e)}"
             logger.error(error_msg)
             return {"sql": "", "error": error_msg, "cost": {}}
 
-    def execute(self, question: str, max_rows: int = 100) -> Dict[str, Any]:
+    def generate_sql_batch(self, questions: List[str]) -> List[Dict[str, Any]]:
+        """Generate SQL for several questions with concurrent LLM calls."""
+        try:
+            responses = self.batcher.invoke_many(
+                [self._build_messages(q) for q in questions]
+            )
+        except Exception as e:
+            error_msg = f"Error generating SQL -> {str(e)}"
+            logger.error(error_msg)
+            return [{"sql": "", "error": error_msg, "cost": {}} for _ in questions]
+
+        results = []
+        for response in responses:
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                results.append(self._parse_response(response))
+            except Exception as e:
+                error_msg = f"Error generating SQL -> {str(e)}"
+                logger.error(error_msg)
+                results.append({"sql": "", "error": error_msg, "cost": {}})
+        return results
+
+    def execute(
+        self, question: str, max_rows: int = 100, columnar: bool = False
+    ) -> Dict[str, Any]:
         """Generate SQL, validate it, and execute it."""
+        return self._run_generated(self.generate_sql(question), max_rows, columnar)
+
+    def execute_batch(
+        self, questions: List[str], max_rows: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Generate SQL for all questions concurrently, then run each query."""
+        return [
+            self._run_generated(gen_result, max_rows)
+            for gen_result in self.generate_sql_batch(questions)
+        ]
+
+    def _run_generated(
+        self, gen_result: Dict[str, Any], max_rows: int, columnar: bool = False
+    ) -> Dict[str, Any]:
+        """Validate and execute one generate_sql result."""
         try:
-            # Generate SQL
-            gen_result = self.generate_sql(question)
             if gen_result.get("error"):
                 return gen_result
 
@@ -81,8 +138,10 @@ class NLToSQLService:
                     "row_count": 0,
                 }
 
-            # Execute query
-            result = self.db.execute_query(sql, max_rows=max_rows)
+            # Execute query, capped in SQL as well as by the fetch
+            result = self.db.execute_query(
+                limit_sql(sql, max_rows), max_rows=max_rows, columnar=columnar
+            )
 
             if result.get("error"):
                 return {
@@ -94,15 +153,19 @@ class NLToSQLService:
                     "row_count": 0,
                 }
 
-            return {
+            output = {
                 "sql": sql,
                 "columns": result["columns"],
-                "rows": result["rows"],
                 "row_count": result["row_count"],
                 "execution_time_ms": result["execution_time_ms"],
                 "truncated": result.get("truncated", False),
                 "cost": gen_result.get("cost", {}),
             }
+            if columnar:
+                output["data"] = result["data"]
+            else:
+                output["rows"] = result["rows"]
+            return output
 
         except Exception as e:
             error_msg = f"Error in NLToSQLService.execute -> {str(e)}"
@@ -1,15 +1,32 @@
 """Report generation service for the Enterprise AI Assistant."""
 
 import json
+import re
 from typing import Any, Dict, List
 
+import pandas as pd
+from langchain_core.messages import HumanMessage, SystemMessage
+
 from logger.logging import get_logger
 from prompt_library.prompts import REPORT_SYSTEM_PROMPT, REPORT_USER_PROMPT
+from services.llm_batcher import get_batcher
 from utils.cost_tracker import CostTracker
 from utils.model_loader import ModelLoader
+from utils.result_cache import CACHED_COST, ResultCache
 
 logger = get_logger(__name__)
 
+# Lines mentioning findings/insights/key open the findings section
+_FINDINGS_MARKER_RE = re.compile(r"finding|insight|key", re.IGNORECASE)
+# Bullet line (already stripped); group 1 is the text after the bullet markers
+_BULLET_RE = re.compile(r"[-*•][-*• ]*(.*)")
+
+
+def _preview_cell(value: Any) -> str:
+    """Stringify a cell, truncated to 200 chars to avoid huge prompts."""
+    text = str(value)
+    return text[:200] + "..." if len(text) > 200 else text
+
 
 class ReportService:
     """Generates markdown reports from query results with business insights."""
@@ -18,7 +35,10 @@ class ReportService:
         try:
             self.model_loader = ModelLoader(model_provider)
             self.llm = self.model_loader.load_llm()
+            self.batcher = get_batcher(self.llm)
             self.cost_tracker = CostTracker()
+            self._system_message = SystemMessage(content=REPORT_SYSTEM_PROMPT)
+            self._cache = ResultCache(maxsize=128)
             logger.info("ReportService initialized")
 
         except Exception as e:
@@ -32,6 +52,7 @@ class ReportService:
         sql: str,
         data: Dict[str, Any],
         report_type: str = "summary",
+        bypass_cache: bool = False,
     ) -> Dict[str, Any]:
         """Generate a markdown report from query results.
 
@@ -40,6 +61,7 @@ class ReportService:
             sql: The SQL query that was executed
             data: Query result with 'columns' and 'rows'
             report_type: 'summary', 'detailed', or 'executive'
+            bypass_cache: Always call the LLM, even for inputs seen before
 
         Returns:
             Dict with markdown, key_findings, data_quality_notes, cost
@@ -49,14 +71,19 @@ class ReportService:
             columns = data.get("columns", [])
             row_count = data.get("row_count", len(rows))
 
+            cache_key = ResultCache.make_key(question, sql, columns, rows, report_type)
+            if not bypass_cache:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    cached["cost"] = dict(CACHED_COST)
+                    return cached
+
             # Format data preview (limit to keep prompt manageable)
             preview_rows = rows[:20]
             data_preview = self._format_data_preview(columns, preview_rows)
 
-            from langchain_core.messages import HumanMessage, SystemMessage
-
             messages = [
-                SystemMessage(content=REPORT_SYSTEM_PROMPT),
+                self._system_message,
                 HumanMessage(
                     content=REPORT_USER_PROMPT.format(
                         report_type=report_type,
@@ -68,7 +95,7 @@ class ReportService:
                 ),
             ]
 
-            response = self.llm.invoke(messages)
+            response = self.batcher.invoke(messages)
             cost_info = self.cost_tracker.track_call(response)
 
             # Parse response
@@ -76,12 +103,14 @@ class ReportService:
             key_findings = self._extract_findings(markdown)
             data_quality_notes = self._extract_quality_notes(markdown, rows, columns)
 
-            return {
+            result = {
                 "markdown": markdown,
                 "key_findings": key_findings,
                 "data_quality_notes": data_quality_notes,
                 "cost": cost_info,
             }
+            self._cache.put(cache_key, result)
+            return result
 
         except Exception as e:
             error_msg = f"Error generating report -> {str(e)}"
@@ -98,27 +127,29 @@ class ReportService:
         if not rows:
             return "No data returned."
 
+        # Canonical (alphabetical) column order keeps the header and cell
+        # layout byte-stable across reports, so provider prefix caches can hit.
+        # Row order is left alone since it usually carries the query's ORDER BY.
+        order = sorted(range(len(columns)), key=columns.__getitem__)
+        columns = [columns[i] for i in order]
+
         # Header
         lines = [" | ".join(columns)]
         lines.append(" | ".join(["---"] * len(columns)))
+        total_len = len(lines[0]) + len(lines[1])
 
         # Rows (limit each value to keep prompt manageable)
         for row in rows:
             if isinstance(row, dict):
-                # Truncate each value to 200 chars to avoid huge prompts if cells have long text
-                values = [
-                    str(row.get(col, ""))[:200]
-                    + ("..." if len(str(row.get(col, ""))) > 200 else "")
-                    for col in columns
-                ]
+                cells = [row.get(col, "") for col in columns]
             else:
-                values = [
-                    str(v)[:200] + ("..." if len(str(v)) > 200 else "") for v in row
-                ]
-            lines.append(" | ".join(values))
+                cells = [row[i] for i in order]
+            line = " | ".join(map(_preview_cell, cells))
+            lines.append(line)
+            total_len += len(line)
 
             # If total length is already too large, stop adding rows
-            if sum(len(line) for line in lines) > 8000:
+            if total_len > 8000:
                 lines.append("... [Additional rows omitted for brevity]")
                 break
 
@@ -127,30 +158,24 @@ class ReportService:
     def _extract_findings(self, markdown: str) -> List[str]:
         """Extract key findings bullet points from the report markdown."""
         findings = []
+        # Fallback: every bullet point, collected in the same pass
+        bullets = []
         in_findings = False
 
         for line in markdown.split("\n"):
             stripped = line.strip()
-            if (
-                "finding" in stripped.lower()
-                or "insight" in stripped.lower()
-                or "key" in stripped.lower()
-            ):
+            bullet = _BULLET_RE.match(stripped)
+            if bullet and len(stripped) > 10:
+                bullets.append(bullet.group(1).strip())
+            if _FINDINGS_MARKER_RE.search(stripped):
                 in_findings = True
-                continue
-            if in_findings and stripped.startswith(("-", "*", "•")):
-                findings.append(stripped.lstrip("-*• ").strip())
+            elif bullet:
+                if in_findings:
+                    findings.append(bullet.group(1).strip())
             elif in_findings and stripped.startswith("#"):
                 in_findings = False
 
-        # Fallback: extract all bullet points
-        if not findings:
-            for line in markdown.split("\n"):
-                stripped = line.strip()
-                if stripped.startswith(("-", "*", "•")) and len(stripped) > 10:
-                    findings.append(stripped.lstrip("-*• ").strip())
-
-        return findings[:5]
+        return (findings or bullets)[:5]
 
     def _extract_quality_notes(
         self, markdown: str, rows: List, columns: List
@@ -167,11 +192,13 @@ class ReportService:
 
         # Check for NULL values
         if rows and isinstance(rows[0], dict):
-            for col in columns:
-                null_count = sum(1 for row in rows if row.get(col) is None)
-                if null_count > 0:
-                    notes.append(
-                        f"Column '{col}' has {null_count} NULL values ({null_count}/{len(rows)} rows)."
-                    )
+            mask = pd.DataFrame(rows, columns=columns).isna()
+            # Only count columns that actually contain a NULL
+            has_nulls = mask.any()
+            null_counts = mask.loc[:, has_nulls].sum()
+            for col, null_count in null_counts.items():
+                notes.append(
+                    f"Column '{col}' has {null_count} NULL values ({null_count}/{len(rows)} rows)."
+                )
 
         return notes
@@ -0,0 +1,79 @@
+"""Plotly chart rendering backend, selected with VIZ_BACKEND=plotly."""
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    import plotly.graph_objects as go
+except ImportError:  # Optional: installed with the "plotly" extra
+    go = None
+
+
+class PlotlyChartBackend:
+    """Renders charts with plotly and rasterises them through kaleido."""
+
+    def __init__(self, width: int = 1000, height: int = 600):
+        if go is None:
+            raise ImportError(
+                "plotly is not installed; install the plotly backend with "
+                "pip install 'enterprise-ai-assistant-mcp[plotly]'"
+            )
+        self.width = width
+        self.height = height
+
+    def render(
+        self,
+        chart_type: str,
+        x_data: List[Any],
+        y_data_dict: Dict[str, np.ndarray],
+        y_cols: List[str],
+        title: str,
+        x_label: str,
+        y_label: str,
+    ) -> bytes:
+        """Build the figure and return the encoded WebP image bytes."""
+        x_str = [str(x) for x in x_data]
+        fig = go.Figure()
+
+        if chart_type == "pie":
+            values = list(y_data_dict.values())[0] if y_data_dict else []
+            fig.add_pie(labels=x_str, values=values, sort=False, rotation=90)
+        elif chart_type == "line":
+            for col in y_cols:
+                fig.add_scatter(
+                    x=x_str, y=y_data_dict[col], mode="lines+markers", name=col
+                )
+        elif chart_type == "scatter":
+            try:
+                x_numeric = [float(x) for x in x_data]
+            except (ValueError, TypeError):
+                x_numeric = list(range(len(x_data)))
+            for col in y_cols:
+                fig.add_scatter(
+                    x=x_numeric,
+                    y=y_data_dict[col],
+                    mode="markers",
+                    name=col,
+                    opacity=0.7,
+                )
+        else:
+            for col in y_cols:
+                fig.add_bar(x=x_str, y=y_data_dict[col], name=col)
+            fig.update_layout(barmode="group")
+
+        fig.update_layout(
+            title={"text": title, "font": {"size": 16}},
+            template="plotly_white",
+            showlegend=len(y_cols) > 1,
+        )
+        if chart_type != "pie":
+            fig.update_xaxes(
+                title_text=x_label, tickangle=-45 if len(x_data) > 6 else 0
+            )
+            fig.update_yaxes(title_text=y_label)
+
+        return fig.to_image(format="webp", width=self.width, height=self.height)
+
+    def discard(self):
+        """Nothing to reset: every chart builds a fresh figure."""
@@ -2,26 +2,183 @@
 
 import base64
 import io
+import threading
+from operator import itemgetter
 from typing import Any, Dict, List
 
-import matplotlib
+import numpy as np
 
-matplotlib.use("Agg")  # Non-interactive backend for server use
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")  # Non-interactive backend for server use
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+except ImportError:  # Optional: installed with the "viz" extra
+    matplotlib = None
 
 from logger.logging import get_logger
+from utils.config_loader import get_default_config
+from utils.result_cache import ResultCache
 
 logger = get_logger(__name__)
 
+# Lossless WebP is several times smaller than matplotlib's PNG for flat-colour
+# charts, which shrinks the base64 payload passed through tool results
+CHART_FORMAT = "webp"
+CHART_MIME = "image/webp"
+CHART_SAVE_KWARGS = {"lossless": True, "method": 6}
+
+
+class MatplotlibChartBackend:
+    """Renders charts with matplotlib's Agg backend (the default)."""
+
+    def __init__(self):
+        if matplotlib is None:
+            raise ImportError(
+                "matplotlib is not installed; install charts support with "
+                "pip install 'enterprise-ai-assistant-mcp[viz]'"
+            )
+        plt.style.use("seaborn-v0_8-whitegrid")
+        # Figures are not thread-safe, so each worker thread reuses its own
+        self._local = threading.local()
+
+    def _get_canvas(self) -> tuple:
+        """Return this thread's reusable figure with a fresh axes."""
+        fig = getattr(self._local, "fig", None)
+        if fig is None:
+            fig = self._local.fig = Figure(figsize=(10, 6))
+        else:
+            # Axes.clear() keeps some state (pie turns the frame off), so only
+            # the figure is reused and the axes are rebuilt
+            fig.clear()
+        return fig, fig.add_subplot()
+
+    def discard(self):
+        """Drop this thread's figure so the next chart starts from a fresh one."""
+        fig = getattr(self._local, "fig", None)
+        if fig is not None:
+            fig.clear()
+            self._local.fig = None
+
+    def render(
+        self,
+        chart_type: str,
+        x_data: List[Any],
+        y_data_dict: Dict[str, np.ndarray],
+        y_cols: List[str],
+        title: str,
+        x_label: str,
+        y_label: str,
+    ) -> memoryview:
+        """Draw the chart and return the encoded image bytes."""
+        fig, ax = self._get_canvas()
+
+        if chart_type == "bar":
+            self._create_bar_chart(ax, x_data, y_data_dict, y_cols)
+        elif chart_type == "line":
+            self._create_line_chart(ax, x_data, y_data_dict, y_cols)
+        elif chart_type == "pie":
+            self._create_pie_chart(
+                ax, x_data, list(y_data_dict.values())[0] if y_data_dict else []
+            )
+        elif chart_type == "scatter":
+            self._create_scatter_chart(ax, x_data, y_data_dict, y_cols)
+        else:
+            self._create_bar_chart(ax, x_data, y_data_dict, y_cols)
+
+        ax.set_title(title, fontsize=14, fontweight="bold")
+        if chart_type != "pie":
+            ax.set_xlabel(x_label, fontsize=11)
+            ax.set_ylabel(y_label, fontsize=11)
+
+            # Rotate x labels if too many
+            if len(x_data) > 6:
+                plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+
+        fig.tight_layout()
+
+        buf = io.BytesIO()
+        fig.savefig(
+            buf,
+            format=CHART_FORMAT,
+            dpi=100,
+            bbox_inches="tight",
+            pil_kwargs=CHART_SAVE_KWARGS,
+        )
+        # Zero-copy view of the encoded image
+        return buf.getbuffer()
+
+    def _create_bar_chart(self, ax, x_data, y_data_dict, y_cols):
+        """Create a bar chart."""
+        x_str = [str(x) for x in x_data]
+        if len(y_cols) == 1:
+            colors = plt.cm.Set2(range(len(x_str)))
+            ax.bar(x_str, list(y_data_dict.values())[0], color=colors)
+        else:
+            x_pos = np.arange(len(x_str))
+            width = 0.8 / len(y_cols)
+            for i, col in enumerate(y_cols):
+                offset = (i - len(y_cols) / 2 + 0.5) * width
+                ax.bar(x_pos + offset, y_data_dict[col], width, label=col)
+            ax.set_xticks(x_pos)
+            ax.set_xticklabels(x_str)
+            ax.legend()
+
+    def _create_line_chart(self, ax, x_data, y_data_dict, y_cols):
+        """Create a line chart."""
+        for col in y_cols:
+            ax.plot(
+                range(len(x_data)), y_data_dict[col], marker="o", label=col, linewidth=2
+            )
+        ax.set_xticks(range(len(x_data)))
+        ax.set_xticklabels([str(x) for x in x_data])
+        if len(y_cols) > 1:
+            ax.legend()
+
+    def _create_pie_chart(self, ax, labels, values):
+        """Create a pie chart."""
+        str_labels = [str(l) for l in labels]
+        colors = plt.cm.Set2(range(len(str_labels)))
+        ax.pie(
+            values, labels=str_labels, autopct="%1.1f%%", colors=colors, startangle=90
+        )
+        ax.axis("equal")
+
+    def _create_scatter_chart(self, ax, x_data, y_data_dict, y_cols):
+        """Create a scatter plot."""
+        try:
+            x_numeric = [float(x) for x in x_data]
+        except (ValueError, TypeError):
+            x_numeric = list(range(len(x_data)))
+
+        for col in y_cols:
+            ax.scatter(x_numeric, y_data_dict[col], label=col, alpha=0.7, s=50)
+        if len(y_cols) > 1:
+            ax.legend()
+
 
 class VisualizationService:
     """Generates charts from query result data."""
 
     def __init__(self):
         try:
-            plt.style.use("seaborn-v0_8-whitegrid")
-            logger.info("VisualizationService initialized")
+            backend = get_default_config().get_env("VIZ_BACKEND", "matplotlib").lower()
+            if backend == "plotly":
+                from services.visualization_backend_plotly import (
+                    PlotlyChartBackend,
+                )
+
+                self._backend = PlotlyChartBackend()
+            else:
+                if backend != "matplotlib":
+                    logger.warning(
+                        f"Unknown VIZ_BACKEND '{backend}', falling back to matplotlib"
+                    )
+                    backend = "matplotlib"
+                self._backend = MatplotlibChartBackend()
+            self._cache = ResultCache(maxsize=128)
+            logger.info(f"VisualizationService initialized ({backend} backend)")
 
         except Exception as e:
             error_msg = f"Error in VisualizationService Initialization -> {str(e)}"
@@ -35,6 +192,7 @@ class VisualizationService:
         title: str = "",
         x_label: str = "",
         y_label: str = "",
+        bypass_cache: bool = False,
     ) -> Dict[str, Any]:
         """Generate a chart from query result data.
 
@@ -44,9 +202,10 @@ class VisualizationService:
             title: Chart title
             x_label: X-axis label
             y_label: Y-axis label
+            bypass_cache: Always re-render, even for inputs seen before
 
         Returns:
-            Dict with chart_base64, chart_type, data_summary
+            Dict with chart_base64, mime, chart_type, data_summary
         """
         try:
             columns = data.get("columns", [])
@@ -66,79 +225,78 @@ class VisualizationService:
                     "chart_type": chart_type,
                 }
 
+            cache_key = ResultCache.make_key(
+                columns, rows, chart_type, title, x_label, y_label
+            )
+            if not bypass_cache:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            col_idx = {c: i for i, c in enumerate(columns)}
+
             # Auto-detect x and y columns if not enough info
-            x_col, y_cols = self._detect_axes(columns, rows)
+            x_col, y_cols = self._detect_axes(columns, rows, col_idx)
 
             if not x_label:
                 x_label = x_col
             if not y_label and y_cols:
                 y_label = y_cols[0]
 
-            # Extract data
-            x_data = [row[x_col] if isinstance(row, dict) else row[0] for row in rows]
-            y_data_dict = {}
-            for y_col in y_cols:
-                y_data_dict[y_col] = [
-                    (
-                        float(row[y_col])
-                        if isinstance(row, dict)
-                        else float(row[columns.index(y_col)])
-                    )
-                    for row in rows
-                ]
-
-            # Create chart
-            fig, ax = plt.subplots(figsize=(10, 6))
-
-            if chart_type == "bar":
-                self._create_bar_chart(ax, x_data, y_data_dict, y_cols)
-            elif chart_type == "line":
-                self._create_line_chart(ax, x_data, y_data_dict, y_cols)
-            elif chart_type == "pie":
-                self._create_pie_chart(
-                    ax, x_data, list(y_data_dict.values())[0] if y_data_dict else []
-                )
-            elif chart_type == "scatter":
-                self._create_scatter_chart(ax, x_data, y_data_dict, y_cols)
+            # Extract data: one pass over the rows, then columnar float arrays
+            if isinstance(rows[0], dict):
+                getter = itemgetter(x_col, *y_cols)
             else:
-                self._create_bar_chart(ax, x_data, y_data_dict, y_cols)
-
-            ax.set_title(
-                title or f"{y_label} by {x_label}", fontsize=14, fontweight="bold"
+                getter = itemgetter(col_idx[x_col], *(col_idx[c] for c in y_cols))
+            table = [getter(row) for row in rows]
+            x_data = [r[0] for r in table]
+            y_values = np.array([r[1:] for r in table], dtype=np.float64).T
+
+            # SQL NULLs arrive as NaN; drop those points instead of plotting gaps
+            complete = ~np.isnan(y_values).any(axis=0)
+            skipped = len(x_data) - int(complete.sum())
+            if skipped == len(x_data):
+                return {
+                    "error": "No non-null numeric values to visualize",
+                    "chart_base64": "",
+                    "chart_type": chart_type,
+                }
+            if skipped:
+                x_data = [x for x, keep in zip(x_data, complete) if keep]
+                y_values = y_values[:, complete]
+            y_values = np.ascontiguousarray(y_values)
+            y_data_dict = {y_col: y_values[i] for i, y_col in enumerate(y_cols)}
+
+            title = title or f"{y_label} by {x_label}"
+            image = self._backend.render(
+                chart_type, x_data, y_data_dict, y_cols, title, x_label, y_label
             )
-            if chart_type != "pie":
-                ax.set_xlabel(x_label, fontsize=11)
-                ax.set_ylabel(y_label, fontsize=11)
-
-                # Rotate x labels if too many
-                if len(x_data) > 6:
-                    plt.xticks(rotation=45, ha="right")
-
-            plt.tight_layout()
-
-            # Convert to base64
-            buf = io.BytesIO()
-            fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
-            buf.seek(0)
-            chart_base64 = base64.b64encode(buf.read()).decode("utf-8")
-            plt.close(fig)
+            # base64 output is pure ASCII
+            chart_base64 = base64.b64encode(image).decode("ascii")
 
             # Generate summary
             data_summary = self._generate_summary(x_data, y_data_dict, y_cols)
+            if skipped:
+                data_summary += f" Skipped {skipped} rows with missing values."
 
-            return {
+            result = {
                 "chart_base64": chart_base64,
+                "mime": CHART_MIME,
                 "chart_type": chart_type,
                 "data_summary": data_summary,
             }
+            self._cache.put(cache_key, result)
+            return result
 
         except Exception as e:
             error_msg = f"Error generating chart -> {str(e)}"
             logger.error(error_msg)
-            plt.close("all")
+            self._backend.discard()
             return {"error": error_msg, "chart_base64": "", "chart_type": chart_type}
 
-    def _detect_axes(self, columns: List[str], rows: List[Dict]) -> tuple:
+    def _detect_axes(
+        self, columns: List[str], rows: List[Dict], col_idx: Dict[str, int]
+    ) -> tuple:
         """Auto-detect which columns to use for x and y axes."""
         x_col = columns[0]
         y_cols = []
@@ -146,9 +304,7 @@ class VisualizationService:
         for col in columns[1:]:
             # Check if column is numeric
             sample = (
-                rows[0][col]
-                if isinstance(rows[0], dict)
-                else rows[0][columns.index(col)]
+                rows[0][col] if isinstance(rows[0], dict) else rows[0][col_idx[col]]
             )
             try:
                 float(sample)
@@ -161,62 +317,12 @@ class VisualizationService:
 
         return x_col, y_cols
 
-    def _create_bar_chart(self, ax, x_data, y_data_dict, y_cols):
-        """Create a bar chart."""
-        x_str = [str(x) for x in x_data]
-        if len(y_cols) == 1:
-            colors = plt.cm.Set2(range(len(x_str)))
-            ax.bar(x_str, list(y_data_dict.values())[0], color=colors)
-        else:
-            import numpy as np
-
-            x_pos = np.arange(len(x_str))
-            width = 0.8 / len(y_cols)
-            for i, col in enumerate(y_cols):
-                offset = (i - len(y_cols) / 2 + 0.5) * width
-                ax.bar(x_pos + offset, y_data_dict[col], width, label=col)
-            ax.set_xticks(x_pos)
-            ax.set_xticklabels(x_str)
-            ax.legend()
-
-    def _create_line_chart(self, ax, x_data, y_data_dict, y_cols):
-        """Create a line chart."""
-        for col in y_cols:
-            ax.plot(
-                range(len(x_data)), y_data_dict[col], marker="o", label=col, linewidth=2
-            )
-        ax.set_xticks(range(len(x_data)))
-        ax.set_xticklabels([str(x) for x in x_data])
-        if len(y_cols) > 1:
-            ax.legend()
-
-    def _create_pie_chart(self, ax, labels, values):
-        """Create a pie chart."""
-        str_labels = [str(l) for l in labels]
-        colors = plt.cm.Set2(range(len(str_labels)))
-        ax.pie(
-            values, labels=str_labels, autopct="%1.1f%%", colors=colors, startangle=90
-        )
-        ax.axis("equal")
-
-    def _create_scatter_chart(self, ax, x_data, y_data_dict, y_cols):
-        """Create a scatter plot."""
-        try:
-            x_numeric = [float(x) for x in x_data]
-        except (ValueError, TypeError):
-            x_numeric = list(range(len(x_data)))
-
-        for col in y_cols:
-            ax.scatter(x_numeric, y_data_dict[col], label=col, alpha=0.7, s=50)
-        if len(y_cols) > 1:
-            ax.legend()
-
     def _generate_summary(self, x_data, y_data_dict, y_cols) -> str:
         """Generate a brief text summary of the chart data."""
         parts = [f"Chart shows {len(x_data)} data points."]
         for col in y_cols:
             values = y_data_dict[col]
             parts.append(
-                f"{col}: min={min(values):.2f}, max={max(values):.2f}, avg={sum(values)/len(values):.2f}"
+                f"{col}: min={np.nanmin(values):.2f}, max={np.nanmax(values):.2f}, avg={np.nanmean(values):.2f}"
             )
         return " ".join(parts)
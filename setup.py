@@ -18,10 +18,15 @@ setup(
         "mcp>=1.0.0",
         "fastapi>=0.115.0",
         "uvicorn>=0.30.0",
+        "orjson>=3.9.0",
         "streamlit>=1.38.0",
         "requests>=2.31.0",
-        "matplotlib>=3.9.0",
         "numpy>=1.26.0",
+        "pandas>=2.0.0",
         "huggingface-hub>=0.20.0",
     ],
+    extras_require={
+        "viz": ["matplotlib>=3.9.0"],
+        "plotly": ["plotly>=5.20.0", "kaleido>=0.2.1"],
+    },
 )
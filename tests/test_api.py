@@ -17,7 +17,7 @@ class TestHealthEndpoints:
         assert app.title == "Enterprise AI Assistant"
 
     def test_mcp_tools_list_structure(self):
-        """MCP tools endpoint should list 3 tools."""
+        """MCP tools endpoint should list 4 tools."""
         from main import app
 
         client = TestClient(app, raise_server_exceptions=False)
@@ -25,4 +25,6 @@ class TestHealthEndpoints:
         if response.status_code == 200:
             data = response.json()
             assert "tools" in data
-            assert len(data["tools"]) == 3
+            assert len(data["tools"]) == 4
+            names = {t["name"] for t in data["tools"]}
+            assert "query_database_batch" in names
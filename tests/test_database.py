@@ -0,0 +1,45 @@
+"""Unit tests for the database manager."""
+
+import pytest
+
+from models.database import DatabaseManager
+
+
+class TestStreamQuery:
+    """Tests for chunked query streaming."""
+
+    @pytest.fixture(autouse=True)
+    def _db(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "test.db"))
+        self.db = DatabaseManager()
+        self.slots = self.db._connections._reader_slots
+
+    def test_yields_chunks_in_order(self):
+        sql = "SELECT customer_id FROM customers ORDER BY customer_id LIMIT 450"
+        chunks = list(self.db.stream_query(sql, chunk=200))
+        assert [len(c) for c in chunks] == [200, 200, 50]
+        ids = [row["customer_id"] for c in chunks for row in c]
+        expected = self.db.execute_query(sql, max_rows=450)["rows"]
+        assert ids == [row["customer_id"] for row in expected]
+
+    def test_empty_result_yields_nothing(self):
+        sql = "SELECT * FROM customers WHERE customer_id < 0"
+        assert list(self.db.stream_query(sql)) == []
+
+    def test_reader_released_when_exhausted(self):
+        free = self.slots._value
+        list(self.db.stream_query("SELECT * FROM products", chunk=50))
+        assert self.slots._value == free
+
+    def test_reader_released_when_closed_early(self):
+        stream = self.db.stream_query("SELECT * FROM products", chunk=50)
+        next(stream)
+        free = self.slots._value
+        stream.close()
+        assert self.slots._value == free + 1
+
+    def test_invalid_sql_raises(self):
+        free = self.slots._value
+        with pytest.raises(Exception, match="Error streaming query"):
+            list(self.db.stream_query("SELECT * FROM missing_table"))
+        assert self.slots._value == free
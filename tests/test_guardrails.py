@@ -1,10 +1,20 @@
 """Unit tests for guardrails."""
 
+import re
+import sqlite3
+
 import pytest
 
 from guardrails.input_guardrails import InputGuardrails
 from guardrails.output_guardrails import OutputGuardrails
-from utils.sql_utils import extract_sql_from_response, validate_sql
+from models.database import DatabaseManager
+from services.guardrail_service import GuardrailService
+from utils.sql_utils import (
+    _strip_string_literals,
+    extract_sql_from_response,
+    limit_sql,
+    validate_sql,
+)
 
 
 class TestInputGuardrails:
@@ -56,6 +66,31 @@ class TestInputGuardrails:
         assert len(results) == 3  # injection, pii, validation
 
 
+class TestGuardrailService:
+    """Tests for input guardrail orchestration."""
+
+    def setup_method(self):
+        self.service = GuardrailService()
+
+    def test_clean_input_runs_all_checks(self):
+        result = self.service.check_input("What are top products?")
+        assert result["allowed"]
+        assert len(result["results"]) == 3
+
+    def test_stops_at_first_block(self):
+        result = self.service.check_input("Write me a poem about databases")
+        assert not result["allowed"]
+        assert len(result["results"]) == 1
+        assert result["results"][0]["guardrail_name"] == "query_validation"
+
+    def test_stats_count_executed_checks(self):
+        self.service.check_input("Write me a poem about databases")
+        stats = self.service.get_stats()
+        assert stats["total_checks"] == 1
+        assert stats["blocks"] == 1
+        assert stats["passes"] == 0
+
+
 class TestOutputGuardrails:
     """Tests for output guardrail validation."""
 
@@ -89,6 +124,35 @@ class TestOutputGuardrails:
         assert masked[0]["city"] == "NYC"  # not in sensitive columns by default
 
 
+class TestTableWhitelist:
+    """Tests for table name checks before names are interpolated into SQL."""
+
+    @pytest.fixture(autouse=True)
+    def _db(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "test.db"))
+        self.db = DatabaseManager()
+
+    def test_known_table_accepted(self):
+        assert self.db._is_known_table("customers")
+
+    def test_unknown_table_rejected(self):
+        assert not self.db._is_known_table("secret_data")
+
+    def test_injected_table_rejected(self):
+        name = "customers'; DROP TABLE orders; --"
+        assert not self.db._is_known_table(name)
+        info = self.db.get_table_info(name)
+        assert info["columns"] == []
+        assert "Unknown table" in info["error"]
+        assert "orders" in self.db.get_table_names()
+
+    def test_real_table_returns_columns(self):
+        info = self.db.get_table_info("customers")
+        assert "error" not in info
+        assert "customer_id" in [c["name"] for c in info["columns"]]
+        assert info["row_count"] > 0
+
+
 class TestSQLUtils:
     """Tests for SQL utility functions."""
 
@@ -112,3 +176,88 @@ class TestSQLUtils:
     def test_extract_plain_sql(self):
         sql = extract_sql_from_response("SELECT COUNT(*) FROM orders")
         assert "SELECT COUNT(*) FROM orders" in sql
+
+    def test_limit_appended_when_missing(self):
+        assert (
+            limit_sql("SELECT * FROM orders", 100) == "SELECT * FROM orders\nLIMIT 100"
+        )
+
+    def test_limit_below_max_kept(self):
+        sql = "SELECT * FROM orders LIMIT 10"
+        assert limit_sql(sql, 100) == sql
+
+    def test_limit_above_max_capped(self):
+        assert limit_sql("SELECT * FROM orders limit 500", 100) == (
+            "SELECT * FROM orders limit 100"
+        )
+
+    def test_limit_offset_caps_row_count(self):
+        assert limit_sql("SELECT * FROM orders LIMIT 500 OFFSET 20", 100) == (
+            "SELECT * FROM orders LIMIT 100 OFFSET 20"
+        )
+        assert limit_sql("SELECT * FROM orders LIMIT 500, 10", 100) == (
+            "SELECT * FROM orders LIMIT 500, 10"
+        )
+
+    def test_limit_trailing_semicolon(self):
+        assert limit_sql("SELECT * FROM orders LIMIT 10; ", 100) == (
+            "SELECT * FROM orders LIMIT 10"
+        )
+        assert limit_sql("SELECT * FROM orders;", 100) == (
+            "SELECT * FROM orders\nLIMIT 100"
+        )
+
+    def test_limit_after_trailing_comment(self):
+        # Appended on its own line so a -- comment cannot swallow it
+        assert limit_sql("SELECT * FROM orders -- all", 100) == (
+            "SELECT * FROM orders -- all\nLIMIT 100"
+        )
+
+    def test_limit_in_subquery_not_final(self):
+        sql = "SELECT * FROM (SELECT * FROM orders LIMIT 5)"
+        assert limit_sql(sql, 100) == sql + "\nLIMIT 100"
+
+    def test_limit_in_string_literal_ignored(self):
+        sql = "SELECT * FROM products WHERE name = 'LIMIT 5'"
+        assert limit_sql(sql, 100) == sql + "\nLIMIT 100"
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM orders LIMIT -1",
+            "SELECT * FROM orders LIMIT :n",
+            "SELECT * FROM orders LIMIT (SELECT 5)",
+            "SELECT * FROM orders LIMIT 10 OFFSET :skip",
+            "WITH o AS (SELECT * FROM orders) SELECT * FROM o LIMIT -1;",
+        ],
+    )
+    def test_non_numeric_limit_wrapped(self, sql):
+        limited = limit_sql(sql, 3)
+        assert limited.startswith("SELECT * FROM (")
+        assert limited.endswith(") LIMIT 3")
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE orders (id INTEGER)")
+        conn.executemany("INSERT INTO orders VALUES (?)", [(i,) for i in range(10)])
+        rows = conn.execute(limited, {"n": 8, "skip": 0}).fetchall()
+        assert len(rows) == 3
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM customers",
+            "SELECT * FROM customers WHERE name = 'Bob'",
+            "SELECT * FROM customers WHERE name = 'O''Brien'",
+            "SELECT * FROM customers WHERE name = 'unterminated",
+            "SELECT 'a', 'b' FROM customers WHERE x = 'c",
+            "SELECT * FROM customers WHERE note = 'DROP TABLE orders; --'",
+            "''''",
+            "'",
+        ],
+    )
+    def test_strip_string_literals_matches_regex(self, sql):
+        assert _strip_string_literals(sql) == re.sub(r"'[^']*'", "", sql)
+
+    def test_strip_string_literals_hides_keywords(self):
+        stripped = _strip_string_literals("SELECT * FROM t WHERE note = 'DELETE -- x'")
+        assert "DELETE" not in stripped and "--" not in stripped
+        assert validate_sql("SELECT * FROM customers WHERE note = 'DROP it'")[0]
@@ -0,0 +1,61 @@
+"""Unit tests for the result cache."""
+
+from unittest.mock import patch
+
+from utils.result_cache import ResultCache
+
+
+class TestResultCache:
+    """Tests for LRU eviction, TTL expiry and copy semantics."""
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(maxsize=2)
+        cache.put(b"a", {"v": 1})
+        cache.put(b"b", {"v": 2})
+        assert cache.get(b"a") == {"v": 1}  # "a" is now most recent
+        cache.put(b"c", {"v": 3})
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == {"v": 1}
+        assert cache.get(b"c") == {"v": 3}
+
+    def test_put_existing_key_refreshes_order(self):
+        cache = ResultCache(maxsize=2)
+        cache.put(b"a", {"v": 1})
+        cache.put(b"b", {"v": 2})
+        cache.put(b"a", {"v": 10})
+        cache.put(b"c", {"v": 3})
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == {"v": 10}
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl=10)
+        with patch("utils.result_cache.time.monotonic", return_value=100.0):
+            cache.put(b"a", {"v": 1})
+        with patch("utils.result_cache.time.monotonic", return_value=109.9):
+            assert cache.get(b"a") == {"v": 1}
+        with patch("utils.result_cache.time.monotonic", return_value=110.0):
+            assert cache.get(b"a") is None
+        assert b"a" not in cache._entries
+
+    def test_no_ttl_never_expires(self):
+        cache = ResultCache()
+        with patch("utils.result_cache.time.monotonic", return_value=0.0):
+            cache.put(b"a", {"v": 1})
+        with patch("utils.result_cache.time.monotonic", return_value=1e9):
+            assert cache.get(b"a") == {"v": 1}
+
+    def test_get_and_put_return_copies(self):
+        cache = ResultCache()
+        value = {"v": 1}
+        cache.put(b"a", value)
+        value["v"] = 2
+        hit = cache.get(b"a")
+        assert hit == {"v": 1}
+        hit["v"] = 3
+        assert cache.get(b"a") == {"v": 1}
+
+    def test_make_key_ignores_dict_order(self):
+        assert ResultCache.make_key({"a": 1, "b": 2}) == ResultCache.make_key(
+            {"b": 2, "a": 1}
+        )
+        assert ResultCache.make_key("q", 1) != ResultCache.make_key("q", 2)
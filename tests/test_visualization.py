@@ -0,0 +1,39 @@
+"""Unit tests for chart generation."""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from services.visualization_service import VisualizationService
+
+
+class TestVisualizationService:
+    """Tests for chart data handling."""
+
+    def setup_method(self):
+        self.service = VisualizationService()
+
+    def test_null_y_value_is_skipped(self):
+        data = {
+            "columns": ["category", "revenue"],
+            "rows": [
+                {"category": "Books", "revenue": 120.0},
+                {"category": "Toys", "revenue": None},
+                {"category": "Games", "revenue": 80.0},
+            ],
+        }
+        result = self.service.generate_chart(data, "bar", bypass_cache=True)
+        assert result["chart_base64"]
+        assert "nan" not in result["data_summary"]
+        assert "Chart shows 2 data points." in result["data_summary"]
+        assert "min=80.00, max=120.00, avg=100.00" in result["data_summary"]
+        assert "Skipped 1 rows with missing values." in result["data_summary"]
+
+    def test_all_null_y_values_error(self):
+        data = {
+            "columns": ["category", "revenue"],
+            "rows": [["Books", None], ["Toys", None]],
+        }
+        result = self.service.generate_chart(data, "pie", bypass_cache=True)
+        assert result["error"]
+        assert result["chart_base64"] == ""
@@ -1,5 +1,7 @@
 """LangChain tool wrapper for chart generation - used by LangGraph agent."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.tools import tool
 
 from logger.logging import get_logger
@@ -8,6 +10,9 @@ from mcp_server.visualization_tool import VisualizationMCPTool
 
 logger = get_logger(__name__)
 
+# One worker, so concurrent first calls construct the backend only once
+_warmup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-warmup")
+
 _viz_tool = None
 _sql_tool = None
 
@@ -44,6 +49,9 @@ def generate_chart(
         y_label: Optional Y-axis label
     """
     try:
+        # Build the chart backend (matplotlib setup) while the query runs
+        viz_tool = _warmup.submit(_get_viz_tool)
+
         # Step 1: Query the database
         query_result = _get_sql_tool().execute(natural_language_query, max_rows=50)
         if query_result.get("error"):
@@ -55,7 +63,7 @@ def generate_chart(
         }
 
         # Step 2: Generate the chart
-        chart_result = _get_viz_tool().execute(
+        chart_result = viz_tool.result().execute(
             data, chart_type, title, x_label, y_label
         )
         chart_result["sql"] = query_result.get("sql", "")
@@ -1,5 +1,7 @@
 """LangChain tool wrapper for report generation - used by LangGraph agent."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.tools import tool
 
 from logger.logging import get_logger
@@ -8,6 +10,9 @@ from mcp_server.sql_tool import SQLTool
 
 logger = get_logger(__name__)
 
+# One worker, so concurrent first calls construct the backend only once
+_warmup = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-warmup")
+
 _report_tool = None
 _sql_tool = None
 
@@ -35,13 +40,16 @@ def generate_report(natural_language_query: str, report_type: str = "summary") -
         report_type: The type of report: 'summary', 'detailed', or 'executive'
     """
     try:
+        # Build the report backend (LLM client, batcher) while the query runs
+        report_tool = _warmup.submit(_get_report_tool)
+
         # Step 1: Query the database
         query_result = _get_sql_tool().execute(natural_language_query, max_rows=100)
         if query_result.get("error"):
             return {"success": False, "error": query_result["error"]}
 
         # Step 2: Generate the report
-        report_result = _get_report_tool().execute(
+        report_result = report_tool.result().execute(
             natural_language_query, query_result, report_type
         )
         report_result["sql"] = query_result.get("sql", "")
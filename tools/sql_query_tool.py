@@ -1,22 +1,39 @@
 """LangChain tool wrapper for SQL queries - used by LangGraph agent."""
 
+import functools
+import re
+
 from langchain_core.tools import tool
 
 from logger.logging import get_logger
 from mcp_server.sql_tool import SQLTool
+from utils.result_cache import CACHED_COST, ResultCache
 
 logger = get_logger(__name__)
 
-_sql_tool = None
-_sql_tool_init_failed = False
+# Agents often repeat a question within a conversation; reuse the answer briefly
+_results = ResultCache(maxsize=256, ttl=60)
+
+# Questions relative to the current time may change answer at any moment
+_VOLATILE_RE = re.compile(
+    r"\b(?:now|today|yesterday|tonight|current(?:ly)?|latest|recent(?:ly)?|"
+    r"this (?:hour|week|month|quarter|year)|"
+    r"(?:last|past) \d* ?(?:minutes?|hours?|days?|weeks?|months?))\b",
+    re.IGNORECASE,
+)
+
+
+def _copy_result(result: dict) -> dict:
+    """Copy a query result down to its rows, so the cache never shares lists."""
+    copied = dict(result)
+    copied["columns"] = list(result.get("columns", []))
+    copied["rows"] = [dict(row) for row in result.get("rows", [])]
+    return copied
 
 
-def _get_tool():
-    global _sql_tool, _sql_tool_init_failed
-    if _sql_tool is None:
-        _sql_tool_init_failed = False
-        _sql_tool = SQLTool()
-    return _sql_tool
+@functools.cache
+def _get_tool() -> SQLTool:
+    return SQLTool()
 
 
 @tool
@@ -27,4 +44,17 @@ def query_database(natural_language_query: str, max_rows: int = 100) -> dict:
         natural_language_query: Question about data (e.g. "top 5 products")
         max_rows: Max number of rows to return (default 100)
     """
-    return _get_tool().execute(natural_language_query, max_rows)
+    if _VOLATILE_RE.search(natural_language_query):
+        return _get_tool().execute(natural_language_query, max_rows)
+
+    key = ResultCache.make_key(natural_language_query, max_rows)
+    cached = _results.get(key)
+    if cached is not None:
+        cached = _copy_result(cached)
+        cached["cost"] = dict(CACHED_COST)
+        return cached
+
+    result = _get_tool().execute(natural_language_query, max_rows)
+    if result.get("success"):
+        _results.put(key, _copy_result(result))
+    return result
@@ -1,48 +1,73 @@
 """Configuration loader for the Enterprise AI Assistant."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
 
-# Load .env BEFORE any other imports that might need env vars
-_project_root = Path(__file__).parent.parent
-_env_paths = [
-    _project_root / ".env",
-    Path.cwd() / ".env",
-    Path(".env"),
-]
+try:
+    # libyaml-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from logger.logging import get_logger
+
+logger = get_logger(__name__)
 
+_project_root = Path(__file__).parent.parent
 _env_loaded = False
-for _env_path in _env_paths:
-    if _env_path.exists():
-        load_dotenv(dotenv_path=_env_path, override=True)
-        _env_loaded = True
-        print(f"[CONFIG] Loaded .env from: {_env_path.absolute()}")
-        break
 
-if not _env_loaded:
-    # Fine on HuggingFace Spaces where secrets are set as env vars
-    pass
+# Parsed config files keyed by (absolute path, mtime_ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], dict] = {}
+# One shared ConfigLoader per config file
+_INSTANCES: Dict[str, "ConfigLoader"] = {}
+_default_config: Optional["ConfigLoader"] = None
 
-from logger.logging import get_logger
 
-logger = get_logger(__name__)
+def _load_env_once():
+    """Load the first .env found, once per process, before env vars are read."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    from dotenv import load_dotenv
+
+    for env_path in (_project_root / ".env", Path.cwd() / ".env", Path(".env")):
+        if env_path.exists():
+            load_dotenv(dotenv_path=env_path, override=True)
+            print(f"[CONFIG] Loaded .env from: {env_path.absolute()}")
+            return
+    # No .env is fine on HuggingFace Spaces where secrets are set as env vars
 
 
 class ConfigLoader:
     """Loads configuration from YAML files and environment variables."""
 
+    def __new__(cls, config_file: str = None):
+        key = config_file or ""
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = _INSTANCES.setdefault(key, super().__new__(cls))
+        return instance
+
     def __init__(self, config_file: str = None):
+        if getattr(self, "config_file", None) is not None:
+            return
         try:
+            _load_env_once()
             if config_file is None:
                 config_file = str(
                     Path(__file__).parent.parent / "config" / "config.yaml"
                 )
+            self.config_data = self.load_config(config_file)
+            # Config and env are fixed at runtime; both caches reset on reload()
+            self._get_cached = functools.lru_cache(maxsize=256)(self._raw_get)
+            self._env_cache: Dict[Tuple[str, Optional[str]], Optional[str]] = {}
             self.config_file = config_file
-            self.config_data = self.load_config()
             logger.info("ConfigLoader initialized successfully")
 
         except Exception as e:
@@ -50,17 +75,26 @@ class ConfigLoader:
             logger.error(error_msg)
             raise Exception(error_msg)
 
-    def load_config(self):
-        """Load configuration from YAML file."""
+    def load_config(self, config_file: str = None):
+        """Load configuration from YAML file, reusing the parse while it is unchanged."""
+        config_file = config_file or self.config_file
         try:
-            config_path = Path(self.config_file)
-            if config_path.exists():
-                with open(config_path, "r") as file:
-                    return yaml.safe_load(file) or {}
-            else:
-                logger.warning(f"Config file {self.config_file} not found.")
+            config_path = Path(config_file)
+            try:
+                mtime_ns = config_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                logger.warning(f"Config file {config_file} not found.")
                 return {}
 
+            key = (str(config_path.resolve()), mtime_ns)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None:
+                # Bytes input: the loader decodes UTF-8 itself
+                with open(config_path, "rb") as file:
+                    cached = yaml.load(file, Loader=SafeLoader) or {}
+                _CONFIG_CACHE[key] = cached
+            return cached
+
         except Exception as e:
             error_msg = f"Error loading configuration -> {str(e)}"
             logger.error(error_msg)
@@ -68,6 +102,14 @@ class ConfigLoader:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
+        try:
+            return self._get_cached(key, default)
+        except TypeError:
+            # Unhashable default; walk the config without caching
+            return self._raw_get(key, default)
+
+    def _raw_get(self, key: str, default: Any = None) -> Any:
+        """Walk the config dict for a dot-notation key."""
         try:
             keys = key.split(".")
             value = self.config_data
@@ -87,7 +129,11 @@ class ConfigLoader:
     def get_env(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get environment variable (already loaded from .env file)."""
         try:
-            return os.getenv(key, default)
+            cache_key = (key, default)
+            if cache_key not in self._env_cache:
+                _load_env_once()
+                self._env_cache[cache_key] = os.getenv(key, default)
+            return self._env_cache[cache_key]
 
         except Exception as e:
             logger.error(f"Error getting environment variable {key} -> {str(e)}")
@@ -114,11 +160,26 @@ class ConfigLoader:
     def reload(self):
         """Reload configuration and .env file."""
         try:
+            from dotenv import load_dotenv
+
             load_dotenv(override=True)
+            config_path = Path(self.config_file).resolve()
+            for key in [k for k in _CONFIG_CACHE if k[0] == str(config_path)]:
+                del _CONFIG_CACHE[key]
             self.config_data = self.load_config()
+            self._get_cached.cache_clear()
+            self._env_cache.clear()
             logger.info("Configuration reloaded successfully")
 
         except Exception as e:
             error_msg = f"Error reloading configuration -> {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg)
+
+
+def get_default_config() -> ConfigLoader:
+    """Return the process-wide ConfigLoader for the default config.yaml."""
+    global _default_config
+    if _default_config is None:
+        _default_config = ConfigLoader()
+    return _default_config
@@ -7,7 +7,7 @@ from functools import wraps
 from typing import Any, Callable, Dict, Optional
 
 from logger.logging import get_logger
-from utils.config_loader import ConfigLoader
+from utils.config_loader import get_default_config
 
 logger = get_logger(__name__)
 
@@ -17,13 +17,16 @@ class CostTracker:
 
     def __init__(self):
         try:
-            self.config = ConfigLoader()
+            self.config = get_default_config()
             self.cost_per_1k_input = float(
                 self.config.get("cost.groq_cost_per_1k_input_tokens", 0.00006)
             )
             self.cost_per_1k_output = float(
                 self.config.get("cost.groq_cost_per_1k_output_tokens", 0.00006)
             )
+            # Per-token rates, so estimate_cost needs no division
+            self._in_per_tok = self.cost_per_1k_input / 1000.0
+            self._out_per_tok = self.cost_per_1k_output / 1000.0
             logger.info("CostTracker initialized")
 
         except Exception as e:
@@ -33,9 +36,10 @@ class CostTracker:
 
     def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
         """Estimate cost in USD for given token counts."""
-        input_cost = (prompt_tokens / 1000) * self.cost_per_1k_input
-        output_cost = (completion_tokens / 1000) * self.cost_per_1k_output
-        return round(input_cost + output_cost, 8)
+        return round(
+            prompt_tokens * self._in_per_tok + completion_tokens * self._out_per_tok,
+            8,
+        )
 
     def extract_usage(self, llm_response: Any) -> Dict[str, int]:
         """Extract token usage from an LLM response."""
@@ -8,23 +8,36 @@ Used by CI/CD pipeline to:
 Also provides download functionality for runtime use.
 """
 
+import hashlib
 import os
 import sys
 from pathlib import Path
 
-from huggingface_hub import HfApi, hf_hub_download
-from huggingface_hub.utils import RepositoryNotFoundError
-
 DEFAULT_REPO_ID = "aniketp2009gmail/enterprise-ai-assistant-db"
 DEFAULT_DB_PATH = "database/ecommerce.db"
 
+# One HfApi client per token, so repeated calls reuse its HTTP session
+_api_cache = {}
+
+
+def _api(token: str):
+    """Return the shared HfApi client for token."""
+    api = _api_cache.get(token)
+    if api is None:
+        from huggingface_hub import HfApi
+
+        api = _api_cache.setdefault(token, HfApi(token=token))
+    return api
+
 
 def ensure_dataset_repo(repo_id: str, token: str) -> bool:
     """Create the HF Dataset repo if it does not exist.
 
     Returns True if repo exists or was created, False on error.
     """
-    api = HfApi(token=token)
+    from huggingface_hub.utils import RepositoryNotFoundError
+
+    api = _api(token)
     try:
         api.repo_info(repo_id=repo_id, repo_type="dataset")
         print(f"Dataset repo '{repo_id}' already exists.")
@@ -43,6 +56,12 @@ def ensure_dataset_repo(repo_id: str, token: str) -> bool:
         return False
 
 
+def _file_sha256(path: Path) -> str:
+    """Hash a file without reading it into memory at once."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def seed_and_upload(repo_id: str, token: str, db_path: str = DEFAULT_DB_PATH):
     """Seed a fresh database and upload it to the HF Dataset."""
     db_file = Path(db_path)
@@ -64,7 +83,8 @@ def seed_and_upload(repo_id: str, token: str, db_path: str = DEFAULT_DB_PATH):
     print(f"Database seeded: {db_file.stat().st_size / 1024:.1f} KB")
 
     # Upload to HF
-    api = HfApi(token=token)
+    api = _api(token)
+    digest = _file_sha256(db_file)
     print(f"Uploading {db_path} to {repo_id}...")
     api.upload_file(
         path_or_fileobj=str(db_file),
@@ -72,6 +92,7 @@ def seed_and_upload(repo_id: str, token: str, db_path: str = DEFAULT_DB_PATH):
         repo_id=repo_id,
         repo_type="dataset",
         commit_message="Update seeded ecommerce database",
+        commit_description=f"sha256: {digest}",
     )
     print("Upload complete.")
 
@@ -79,9 +100,13 @@ def seed_and_upload(repo_id: str, token: str, db_path: str = DEFAULT_DB_PATH):
 def download_db(repo_id: str, token: str, target_path: str) -> bool:
     """Download the database from HF Dataset to target_path.
 
-    Returns True on success, False on failure.
+    Returns True on success, False on failure. The file is written straight
+    into target_path's directory; on later boots the hub compares the remote
+    ETag with its local metadata and skips the download when unchanged.
     """
     try:
+        from huggingface_hub import hf_hub_download
+
         target = Path(target_path)
         target.parent.mkdir(parents=True, exist_ok=True)
 
@@ -91,7 +116,6 @@ def download_db(repo_id: str, token: str, target_path: str) -> bool:
             repo_type="dataset",
             token=token,
             local_dir=str(target.parent),
-            local_dir_use_symlinks=False,
         )
         print(f"Database downloaded to {target_path}")
         return True
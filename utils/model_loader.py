@@ -1,21 +1,27 @@
 """Model loader for the Enterprise AI Assistant."""
 
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Tuple
 
 from langchain_groq import ChatGroq
 
 from logger.logging import get_logger
-from utils.config_loader import ConfigLoader
+from utils.config_loader import get_default_config
 
 logger = get_logger(__name__)
 
+# Clients shared by every loader with the same settings, so services that use
+# the same model also share one HTTP client and one request batcher
+_GROQ_MODELS: Dict[Tuple[str, str, float, int], ChatGroq] = {}
+_GROQ_MODELS_LOCK = threading.Lock()
+
 
 class ModelLoader:
     """Loads and configures language models."""
 
     def __init__(self, model_provider: str = "groq"):
         try:
-            self.config = ConfigLoader()
+            self.config = get_default_config()
             self.model_provider = model_provider.lower()
             self.llm = None
             logger.info("ModelLoader initialized")
@@ -65,14 +71,18 @@ class ModelLoader:
                 logger.warning("Invalid MODEL_MAX_TOKENS, using default 4096")
                 max_tokens = 4096
 
-            logger.info(f"Loading Groq model: {model_name}")
-
-            return ChatGroq(
-                groq_api_key=api_key,
-                model_name=model_name,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            key = (api_key, model_name, temperature, max_tokens)
+            with _GROQ_MODELS_LOCK:
+                llm = _GROQ_MODELS.get(key)
+                if llm is None:
+                    logger.info(f"Loading Groq model: {model_name}")
+                    llm = _GROQ_MODELS[key] = ChatGroq(
+                        groq_api_key=api_key,
+                        model_name=model_name,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+            return llm
 
         except Exception as e:
             error_msg = f"Error in _load_groq_model -> {str(e)}"
@@ -0,0 +1,59 @@
+"""Small thread-safe LRU cache for expensive service results."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Cost reported for a result served from cache (no LLM call was made)
+CACHED_COST = {
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "total_tokens": 0,
+    "estimated_cost_usd": 0.0,
+    "cached": True,
+}
+
+
+class ResultCache:
+    """Keeps the most recent result dicts, keyed by a digest of their inputs.
+
+    With ttl (seconds) set, entries also expire that long after being stored.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry on the monotonic clock or None, result)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """Hash JSON-serialisable inputs into a compact cache key."""
+        payload = json.dumps(parts, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(value)
+
+    def put(self, key: bytes, value: Dict[str, Any]):
+        """Store a result, evicting the least recently used entry when full."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
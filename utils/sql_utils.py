@@ -1,7 +1,8 @@
 """SQL validation and sanitization utilities."""
 
+import functools
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from logger.logging import get_logger
 
@@ -37,33 +38,105 @@ ALLOWED_TABLES = [
     "inventory_log",
 ]
 
+_ALLOWED_TABLES_SET = frozenset(t.lower() for t in ALLOWED_TABLES)
+
+# Words the FROM/JOIN pattern can capture that are never table names
+_SQL_KEYWORDS = frozenset(
+    {
+        "select",
+        "where",
+        "and",
+        "or",
+        "not",
+        "null",
+        "as",
+        "on",
+        "in",
+        "is",
+        "by",
+        "asc",
+        "desc",
+        "case",
+        "when",
+        "then",
+        "else",
+        "end",
+        "between",
+        "like",
+        "having",
+        "union",
+        "all",
+        "exists",
+        "each",
+        "lateral",
+    }
+)
+
+# Patterns are compiled once at import; validation runs on every generated query
+_BLOCKED_RE = re.compile(r"\b(" + "|".join(map(re.escape, BLOCKED_OPERATIONS)) + r")\b")
+_CTE_RE = re.compile(r"\bWITH\s+(.*?)\bSELECT\b", re.DOTALL)
+_CTE_NAME_RE = re.compile(r"(\w+)\s+AS\s*\(")
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?!\s*\()")
+_EXTRACT_RE = re.compile(r"\bEXTRACT\s*\([^)]*\bFROM\s+(\w+)")
+_CODE_BLOCK_RE = re.compile(r"```(?:sql)?\s*\n?(.*?)\n?```", re.DOTALL | re.IGNORECASE)
+# "LIMIT n OFFSET m" puts the row count first, "LIMIT m, n" puts it last
+_TRAILING_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)(?:\s*(?:(OFFSET)|,)\s*(\d+))?\s*$")
+_LIMIT_RE = re.compile(r"\bLIMIT\b")
+_SELECT_RE = re.compile(
+    r"((?:WITH\s+.*?\s+AS\s*\(.*?\)\s*)?SELECT\s+.*?)(?:\n\n|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def _strip_string_literals(sql: str) -> str:
+    """Remove '...' literals in one linear pass.
+
+    Same result as re.sub(r"'[^']*'", "", sql): quotes pair up left to right
+    and an unmatched trailing quote is kept along with the text after it.
+    """
+    if "'" not in sql:
+        return sql
+    parts = sql.split("'")
+    if len(parts) % 2:
+        return "".join(parts[::2])
+    return "".join(parts[:-1:2]) + "'" + parts[-1]
+
 
 def validate_sql(sql: str, allowed_tables: List[str] = None) -> Tuple[bool, str]:
     """Validate a generated SQL query for safety.
 
+    Results are cached by SQL text, since retries and common questions
+    regenerate the same queries.
+
     Returns:
         (is_valid, error_message)
     """
-    if allowed_tables is None:
-        allowed_tables = ALLOWED_TABLES
+    tables_key = None if allowed_tables is None else tuple(allowed_tables)
+    return _validate_sql_cached(sql, tables_key)
+
 
+@functools.lru_cache(maxsize=1024)
+def _validate_sql_cached(
+    sql: str, allowed_tables: Optional[Tuple[str, ...]]
+) -> Tuple[bool, str]:
     sql_upper = sql.upper().strip()
 
     # Must start with SELECT or WITH (for CTEs)
     if not sql_upper.startswith("SELECT") and not sql_upper.startswith("WITH"):
         return False, "Only SELECT queries are allowed"
 
-    # Check for blocked operations
-    for op in BLOCKED_OPERATIONS:
-        # Match as whole word to avoid false positives (e.g., "UPDATED_AT")
-        pattern = rf"\b{op}\b"
-        # Skip checking inside string literals by removing them first
-        sql_no_strings = re.sub(r"'[^']*'", "", sql_upper)
-        if re.search(pattern, sql_no_strings):
-            return False, f"Blocked operation detected: {op}"
+    # String literals are stripped once up front so keywords inside them
+    # never trigger the checks below
+    sql_no_strings_upper = _strip_string_literals(sql_upper)
+    sql_no_strings = _strip_string_literals(sql)
+
+    # Check for blocked operations in a single scan
+    # Match as whole word to avoid false positives (e.g., "UPDATED_AT")
+    blocked = _BLOCKED_RE.search(sql_no_strings_upper)
+    if blocked:
+        return False, f"Blocked operation detected: {blocked.group(1)}"
 
     # Check for multiple statements (SQL injection via semicolons)
-    sql_no_strings = re.sub(r"'[^']*'", "", sql)
     if ";" in sql_no_strings.rstrip(";").rstrip():
         return False, "Multiple statements not allowed"
 
@@ -77,61 +150,37 @@ def validate_sql(sql: str, allowed_tables: List[str] = None) -> Tuple[bool, str]
     #   - Subquery aliases: FROM (SELECT ...) alias
     #   - EXTRACT syntax: EXTRACT(MONTH FROM col)
     #   - Function calls: FROM func(...)
-    sql_clean = re.sub(r"'[^']*'", "", sql_upper)
-
-    # Collect CTE names so we can exclude them
-    cte_names = set()
-    cte_pattern = r"\bWITH\s+(.*?)\bSELECT\b"
-    cte_block = re.search(cte_pattern, sql_clean, re.DOTALL)
-    if cte_block:
-        for m in re.finditer(r"(\w+)\s+AS\s*\(", cte_block.group(1)):
-            cte_names.add(m.group(1).lower())
 
     # Match table names after FROM/JOIN, but skip:
     #   - "(" after the name (subquery or function)
     #   - FROM preceded by EXTRACT/DISTINCT/etc. (not a table clause)
-    table_pattern = r"\b(?:FROM|JOIN)\s+(\w+)(?!\s*\()"
-    matches = re.findall(table_pattern, sql_clean)
+    matches = _TABLE_RE.findall(sql_no_strings_upper)
     referenced_tables = set(t.lower() for t in matches)
 
-    # Remove CTE names and common SQL keywords that aren't tables
-    sql_keywords = {
-        "select",
-        "where",
-        "and",
-        "or",
-        "not",
-        "null",
-        "as",
-        "on",
-        "in",
-        "is",
-        "by",
-        "asc",
-        "desc",
-        "case",
-        "when",
-        "then",
-        "else",
-        "end",
-        "between",
-        "like",
-        "having",
-        "union",
-        "all",
-        "exists",
-        "each",
-        "lateral",
-    }
-    referenced_tables -= cte_names
-    referenced_tables -= sql_keywords
+    # Remove common SQL keywords that aren't tables
+    referenced_tables -= _SQL_KEYWORDS
+
+    # Most queries are plain SELECTs; the CTE and EXTRACT scans only run when
+    # their keyword is present at all
+    if "WITH" in sql_no_strings_upper:
+        # Remove CTE names so they aren't mistaken for unknown tables
+        cte_block = _CTE_RE.search(sql_no_strings_upper)
+        if cte_block:
+            for m in _CTE_NAME_RE.finditer(cte_block.group(1)):
+                referenced_tables.discard(m.group(1).lower())
+
+    if "EXTRACT" in sql_no_strings_upper:
+        # Also remove any word captured from EXTRACT(... FROM column_name)
+        for m in _EXTRACT_RE.finditer(sql_no_strings_upper):
+            referenced_tables.discard(m.group(1).lower())
 
-    # Also remove any word captured from EXTRACT(... FROM column_name)
-    extract_pattern = r"\bEXTRACT\s*\([^)]*\bFROM\s+(\w+)"
-    for m in re.finditer(extract_pattern, sql_clean):
-        referenced_tables.discard(m.group(1).lower())
+    if not referenced_tables:
+        return True, ""
 
-    allowed_set = set(t.lower() for t in allowed_tables)
+    if allowed_tables is None:
+        allowed_set = _ALLOWED_TABLES_SET
+    else:
+        allowed_set = frozenset(t.lower() for t in allowed_tables)
     invalid_tables = referenced_tables - allowed_set
     if invalid_tables:
         # Separate likely aliases (short, 1-3 chars) from truly unknown tables.
@@ -148,6 +197,11 @@ def validate_sql(sql: str, allowed_tables: List[str] = None) -> Tuple[bool, str]
     return True, ""
 
 
+validate_sql.cache_clear = _validate_sql_cached.cache_clear
+validate_sql.cache_info = _validate_sql_cached.cache_info
+
+
+@functools.lru_cache(maxsize=512)
 def sanitize_sql(sql: str) -> str:
     """Clean up SQL for display/execution."""
     # Remove leading/trailing whitespace and semicolons
@@ -162,17 +216,50 @@ def sanitize_sql(sql: str) -> str:
     return sql
 
 
+def _has_top_level_limit(stripped: str) -> bool:
+    """Check for a LIMIT keyword outside any parentheses."""
+    for match in _LIMIT_RE.finditer(stripped):
+        prefix = stripped[: match.start()]
+        if prefix.count("(") == prefix.count(")"):
+            return True
+    return False
+
+
+def limit_sql(sql: str, max_rows: int) -> str:
+    """Cap the final LIMIT of a query at max_rows, appending one if missing.
+
+    A LIMIT lets SQLite stop early and use a bounded top-N sort for ORDER BY,
+    instead of sorting the whole result only to keep the first rows.
+    """
+    max_rows = int(max_rows)
+    sql = sql.rstrip().rstrip(";").rstrip()
+    stripped = _strip_string_literals(sql.upper())
+    match = _TRAILING_LIMIT_RE.search(stripped)
+    if match is None:
+        if _has_top_level_limit(stripped):
+            # LIMIT -1, :n or (SELECT ...) cannot be capped in place, and a
+            # second LIMIT is a syntax error, so cap the query from outside
+            return f"SELECT * FROM (\n{sql}\n) LIMIT {max_rows}"
+        return f"{sql}\nLIMIT {max_rows}"
+    group = 1 if match.group(2) or match.group(3) is None else 3
+    if int(match.group(group)) <= max_rows:
+        return sql
+    # The matched tail holds no quotes, so it sits at the same offset from the end
+    start = len(sql) - (len(stripped) - match.start(group))
+    end = len(sql) - (len(stripped) - match.end(group))
+    return f"{sql[:start]}{max_rows}{sql[end:]}"
+
+
+@functools.lru_cache(maxsize=512)
 def extract_sql_from_response(text: str) -> str:
     """Extract SQL query from an LLM response that may contain markdown or explanations."""
     # Try to find SQL in code blocks
-    code_block_pattern = r"```(?:sql)?\s*\n?(.*?)\n?```"
-    matches = re.findall(code_block_pattern, text, re.DOTALL | re.IGNORECASE)
+    matches = _CODE_BLOCK_RE.findall(text)
     if matches:
         return sanitize_sql(matches[0])
 
     # Look for SELECT statement in the text
-    select_pattern = r"((?:WITH\s+.*?\s+AS\s*\(.*?\)\s*)?SELECT\s+.*?)(?:\n\n|\Z)"
-    matches = re.findall(select_pattern, text, re.DOTALL | re.IGNORECASE)
+    matches = _SELECT_RE.findall(text)
     if matches:
         return sanitize_sql(matches[0])
 